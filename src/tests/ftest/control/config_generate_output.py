@@ -5,6 +5,7 @@
   SPDX-License-Identifier: BSD-2-Clause-Patent
 '''
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import yaml
 
 from apricot import TestWithServers, skipForTicket
@@ -19,6 +20,15 @@ class ConfigGenerateOutput(TestWithServers):
 
     :avocado: recursive
     """
+
+    # Whether to check every valid value of a swept option or only the lower
+    # and upper boundaries.
+    EXHAUSTIVE = False
+
+    # Whether to stop verifying the engines of a generated --net-class config
+    # once an error has been found in it.
+    FAIL_FAST = True
+
     def __init__(self, *args, **kwargs):
         """Initialize a ConfigGenerateOutput object."""
         super().__init__(*args, **kwargs)
@@ -28,28 +38,65 @@ class ConfigGenerateOutput(TestWithServers):
         self.pci_address_set = set()
         self.scm_namespace_set = set()
 
-        self.interface_to_providers = defaultdict(list)
+        self.interface_to_providers = defaultdict(set)
         self.interface_set = set()
 
-    def prepare_expected_data(self):
+        # Set once the expected values have been collected.
+        self._expected_prepared = False
+
+        # Parsed dmg scan output keyed by the scan method and its arguments.
+        self._scan_output = {}
+
+    def get_scan_output(self, dmg, scan, **kwargs):
+        """Get the parsed output of a dmg scan command.
+
+        The parsed JSON output is cached so that repeating the same scan does
+        not run the command again.
+
+        Args:
+            dmg (DmgCommand): dmg command used to run the scan.
+            scan (str): name of the DmgCommand scan method, e.g. storage_scan.
+            kwargs (dict): arguments to pass to the scan method.
+
+        Returns:
+            dict: the parsed JSON output of the scan command.
+
+        """
+        key = (scan, frozenset(kwargs.items()))
+        if key not in self._scan_output:
+            output = getattr(dmg, scan)(**kwargs)
+
+            # Check the status.
+            if output["status"] != 0:
+                self.log.error(output["error"])
+                self.fail("dmg {} failed!".format(scan.replace("_", " ")))
+
+            self._scan_output[key] = output
+        return self._scan_output[key]
+
+    def prepare_expected_data(self, dmg=None):
         """Prepare expected values.
 
-        Call dmg storage scan and network scan to collect expected values.
+        Call dmg storage scan and network scan to collect expected values. The
+        values are only collected on the first call.
+
+        Args:
+            dmg (DmgCommand, optional): dmg command to use to run the scans.
+                Defaults to None, which uses the test's dmg command.
         """
-        dmg = self.get_dmg_command()
+        if self._expected_prepared:
+            return
 
-        # Call dmg storage scan --json.
-        storage_out = dmg.storage_scan()
+        if dmg is None:
+            dmg = self.get_dmg_command()
 
-        # Check the status.
-        if storage_out["status"] != 0:
-            self.log.error(storage_out["error"])
-            self.fail("dmg storage scan failed!")
+        # Call dmg storage scan --json.
+        storage_out = self.get_scan_output(dmg, "storage_scan")
 
         # Get nvme_devices and scm_namespaces list that are buried. There's a
         # uint64 hash of the strcut under HostStorage.
         temp_dict = storage_out["response"]["HostStorage"]
-        struct_hash = list(temp_dict.keys())[0]
+        struct_hash = next(iter(temp_dict))
         nvme_devices = temp_dict[struct_hash]["storage"]["nvme_devices"]
         scm_namespaces = temp_dict[struct_hash]["storage"]["scm_namespaces"]
 
@@ -76,29 +123,34 @@ class ConfigGenerateOutput(TestWithServers):
         self.log.info("scm_namespace_set = %s", self.scm_namespace_set)
 
         # Call dmg network scan --provider=all --json.
-        network_out = dmg.network_scan(provider="all")
-
-        # Check the status.
-        if network_out["status"] != 0:
-            self.log.error(network_out["error"])
-            self.fail("dmg network scan failed!")
+        network_out = self.get_scan_output(dmg, "network_scan", provider="all")
 
         # Get the hash and the Interfaces list.
         temp_dict = network_out["response"]["HostFabrics"]
-        struct_hash = list(temp_dict.keys())[0]
+        struct_hash = next(iter(temp_dict))
         interfaces = temp_dict[struct_hash]["HostFabric"]["Interfaces"]
 
         # Fill in the dictionary and the set for interface.
         for interface in interfaces:
             provider = interface["Provider"]
             device = interface["Device"]
-            self.interface_to_providers[device].append(provider)
+            self.interface_to_providers[device].add(provider)
             self.interface_set.add(device)
 
         self.log.info(
             "interface_to_providers = %s", self.interface_to_providers)
         self.log.info("interface_set = %s", self.interface_set)
 
+        # The expected values are only read from now on, so convert them to
+        # plain dictionaries to avoid adding entries on missed lookups.
+        self.nvme_socket_to_addrs = dict(self.nvme_socket_to_addrs)
+        self.scm_socket_to_namespaces = dict(self.scm_socket_to_namespaces)
+        self.interface_to_providers = {
+            device: frozenset(providers)
+            for device, providers in self.interface_to_providers.items()}
+
+        self._expected_prepared = True
+
     def check_errors(self, errors):
         """Check if there's any error in given list. If so, fail the test.
 
@@ -109,6 +161,45 @@ class ConfigGenerateOutput(TestWithServers):
             self.fail("\n----- Errors detected! -----\n{}".format(
                 "\n".join(errors)))
 
+    def get_valid_range(self, maximum):
+        """Get the valid option values, starting from 1, to verify.
+
+        Args:
+            maximum (int): largest valid value.
+
+        Returns:
+            list: every value from 1 to maximum if EXHAUSTIVE is set; otherwise
+                only the 1 and maximum boundary values.
+
+        """
+        if self.EXHAUSTIVE:
+            return list(range(1, maximum + 1))
+        return sorted({1, maximum}) if maximum >= 1 else []
+
+    def config_generate_parallel(self, kwargs_list):
+        """Run dmg config generate concurrently with different arguments.
+
+        Each invocation uses its own DmgCommand object as the command object
+        stores the sub-command state while it runs.
+
+        Args:
+            kwargs_list (list): list of dictionaries of the config_generate
+                arguments to use, other than access_points, for each command.
+
+        Returns:
+            list: CmdResult objects in the same order as kwargs_list.
+
+        """
+        def _config_generate(kwargs):
+            dmg = DmgCommand(self.bin)
+            dmg.exit_status_exception = False
+            return dmg.config_generate(access_points="wolf-a", **kwargs)
+
+        if not kwargs_list:
+            return []
+        with ThreadPoolExecutor(max_workers=min(len(kwargs_list), 8)) as pool:
+            return list(pool.map(_config_generate, kwargs_list))
+
     def verify_access_point(self, host_port_input, failure_expected=None):
         """Run with given AP and verify the AP in the output.
 
@@ -158,7 +249,7 @@ class ConfigGenerateOutput(TestWithServers):
         elif result.exit_status != 0 and failure_expected is not None:
             if failure_expected not in result.stderr_text:
                 errors.append(
-                    "Missing expected error message in failed dmg command!: " +
+                    "Missing expected error message in failed dmg command!: "
                     "{}".format(result))
         else:
             errors.append(
@@ -166,6 +257,75 @@ class ConfigGenerateOutput(TestWithServers):
 
         return errors
 
+    def verify_net_class(self, net_class, max_engines):
+        """Run with given --net-class and verify the output.
+
+        Call dmg config generate --num-engines=<1 to max_engines> with the
+        net_class, which should pass, and verify each engine's fabric_iface and
+        provider. Then call it with --num-engines=<max_engines + 1>, which
+        should fail.
+
+        Args:
+            net_class (str): network class, i.e. "infiniband" or "ethernet".
+            max_engines (int): number of interfaces in the network class.
+
+        Returns:
+            list: List or errors.
+
+        """
+        errors = []
+
+        # Expected providers of each interface, used by every engine check.
+        interface_to_providers = self.interface_to_providers
+
+        # Call dmg config generate --num-engines=<1 to max_engines>
+        # --net-class=<net_class>. Should pass.
+        engines_range = range(1, max_engines + 1)
+        results = self.config_generate_parallel(
+            [{"num_engines": num_engines, "net_class": net_class}
+             for num_engines in engines_range])
+        for num_engines, result in zip(engines_range, results):
+            # dmg config generate should pass.
+            if result.exit_status != 0:
+                msg = "config generate failed with --net-class={} "\
+                    "--num-engines = {}!".format(net_class, num_engines)
+                errors.append(msg)
+            else:
+                generated_config = yaml.safe_load(result.stdout)
+                start = len(errors)
+                for engine in generated_config["engines"]:
+                    if self.FAIL_FAST and len(errors) > start:
+                        break
+                    fabric_iface = engine["fabric_iface"]
+                    provider = engine["provider"]
+                    # Verify fabric_iface field, e.g., ib0 by checking the
+                    # dictionary keys.
+                    providers = interface_to_providers.get(fabric_iface)
+                    if not providers:
+                        errors.append(
+                            "Unexpected fabric_iface! {}".format(fabric_iface))
+                    elif provider not in providers:
+                        # Now check the provider field, e.g., ofi+sockets by
+                        # checking the corresponding set in the dictionary.
+                        msg = "Unexpected provider in fabric_iface! provider ="\
+                            " {}; fabric_iface = {}".format(
+                                provider, fabric_iface)
+                        errors.append(msg)
+
+        # Call dmg config generate --num-engines=<max_engines + 1>
+        # --net-class=<net_class>. Too many engines. Should fail.
+        dmg = DmgCommand(self.bin)
+        dmg.exit_status_exception = False
+        result = dmg.config_generate(
+            access_points="wolf-a", num_engines=max_engines + 1,
+            net_class=net_class)
+        if result.exit_status == 0:
+            msg = "config generate succeeded with --net-class={}, "\
+                "num_engines = {}!".format(net_class, max_engines + 1)
+            errors.append(msg)
+
+        return errors
+
     def test_basic_config(self):
         """Test basic configuration.
 
@@ -177,48 +337,52 @@ class ConfigGenerateOutput(TestWithServers):
         3. Iterate bdev_list address list and verify that it's in the NVMe PCI
         address set.
         4. Get fabric_iface and verify that it's in the interface set.
-        5. Repeat for all engines.
+        5. Repeat for all engines. The values of all the engines are checked
+        together.
 
         :avocado: tags=all,full_regression
         :avocado: tags=hw,small
         :avocado: tags=control,config_generate_entries,basic_config
         """
+        dmg = self.get_dmg_command()
+
         # Get necessary storage and network info.
-        self.prepare_expected_data()
+        self.prepare_expected_data(dmg)
 
         # Call dmg config generate.
-        result = self.get_dmg_command().config_generate(access_points="wolf-a")
+        result = dmg.config_generate(access_points="wolf-a")
         generated_yaml = yaml.safe_load(result.stdout)
 
         errors = []
 
-        # Iterate engines and verify scm_list, bdev_list, and fabric_iface.
+        # Gather scm_list, bdev_list, and fabric_iface values of all engines and
+        # verify them against the expected sets.
         engines = generated_yaml["engines"]
-        for engine in engines:
-            # Verify the scm_list value is in the SCM Namespace set. e.g.,
-            # if the value is /dev/pmem0, check pmem0 is in the set.
-            scm_list = engine["scm_list"]
-            for scm_dev in scm_list:
-                device_name = scm_dev.split("/")[-1]
-                if device_name not in self.scm_namespace_set:
-                    errors.append(
-                        "Cannot find SCM device name {} in expected set {}"\
-                            .format(device_name, self.scm_namespace_set))
 
-            # Verify the bdev_list values are in the NVMe PCI address set.
-            bdev_list = engine["bdev_list"]
-            for pci_addr in bdev_list:
-                if pci_addr not in self.pci_address_set:
-                    errors.append(
-                        "Cannot find PCI address {} in expected set {}".format(
-                            pci_addr, self.pci_address_set))
+        # Verify the scm_list values are in the SCM Namespace set. e.g., if the
+        # value is /dev/pmem0, check pmem0 is in the set.
+        scm_names = {
+            scm_dev[scm_dev.rfind("/") + 1:]
+            for engine in engines for scm_dev in engine["scm_list"]}
+        errors.extend(
+            "Cannot find SCM device name {} in expected set {}".format(
+                device_name, self.scm_namespace_set)
+            for device_name in scm_names - self.scm_namespace_set)
 
-            # Verify fabric interface values are in the interface set.
-            fabric_iface = engine["fabric_iface"]
-            if fabric_iface not in self.interface_set:
-                errors.append(
-                    "Cannot find fabric interface {} in expected set {}".format(
-                        fabric_iface, self.interface_set))
+        # Verify the bdev_list values are in the NVMe PCI address set.
+        pci_addrs = {
+            pci_addr for engine in engines for pci_addr in engine["bdev_list"]}
+        errors.extend(
+            "Cannot find PCI address {} in expected set {}".format(
+                pci_addr, self.pci_address_set)
+            for pci_addr in pci_addrs - self.pci_address_set)
+
+        # Verify fabric interface values are in the interface set.
+        fabric_ifaces = {engine["fabric_iface"] for engine in engines}
+        errors.extend(
+            "Cannot find fabric interface {} in expected set {}".format(
+                fabric_iface, self.interface_set)
+            for fabric_iface in fabric_ifaces - self.interface_set)
 
         self.check_errors(errors)
 
@@ -305,7 +469,7 @@ class ConfigGenerateOutput(TestWithServers):
         1. Using the NVMe PCI dictionary, find the number of keys. i.e., number
         of Socket IDs. This would determine the maximum number of engines.
         2. Call dmg config generate --num-engines=<1 to max_engine>. Should
-        pass.
+        pass. Only 1 and max_engine are used unless EXHAUSTIVE is set.
         3. Call dmg config generate --num-engines=<max_engine + 1> Should fail.
 
         :avocado: tags=all,full_regression
@@ -319,7 +483,7 @@ class ConfigGenerateOutput(TestWithServers):
         # sockets in NVMe. However, I'm not sure if we need to have the same
         # number of interfaces. Go over this step if we have issue with the
         # max_engine assumption.
-        max_engine = len(list(self.nvme_socket_to_addrs.keys()))
+        max_engine = len(self.nvme_socket_to_addrs)
         self.log.info("max_engine threshold = %s", max_engine)
 
         dmg = DmgCommand(self.bin)
@@ -327,9 +491,10 @@ class ConfigGenerateOutput(TestWithServers):
         errors = []
 
         # Call dmg config generate --num-engines=<1 to max_engine>
-        for num_engines in range(1, max_engine + 1):
-            result = dmg.config_generate(
-                access_points="wolf-a", num_engines=num_engines)
+        engines_range = self.get_valid_range(max_engine)
+        results = self.config_generate_parallel(
+            [{"num_engines": num_engines} for num_engines in engines_range])
+        for num_engines, result in zip(engines_range, results):
             generated_yaml = yaml.safe_load(result.stdout)
             actual_num_engines = len(generated_yaml["engines"])
 
@@ -355,6 +520,7 @@ class ConfigGenerateOutput(TestWithServers):
         1. Iterate the NVMe PCI dictionary and find the key that has the
         shortest list. This would be our min_ssd engine count threshold.
         2. Call dmg config generate --min-ssds=<1 to min_ssd>. Should pass.
+        Only 1 and min_ssd are used unless EXHAUSTIVE is set.
         3. Call dmg config generate --min-ssds=<min_ssd + 1>. Should fail.
         4. Call dmg config generate --min-ssds=0. Iterate the engines field and
         verify that there's no bdev_list field.
@@ -368,14 +534,9 @@ class ConfigGenerateOutput(TestWithServers):
 
         # Iterate the NVMe PCI dictionary and find the key that has the shortest
         # list. This would be our min_ssd engine count threshold.
-        socket_ids = list(self.nvme_socket_to_addrs.keys())
-        shortest_id = socket_ids[0]
-        shortest = len(self.nvme_socket_to_addrs[shortest_id])
-        for socket_id in socket_ids:
-            if len(self.nvme_socket_to_addrs[socket_id]) < shortest:
-                shortest = len(self.nvme_socket_to_addrs[socket_id])
-                shortest_id = socket_id
-
+        shortest_id = min(
+            self.nvme_socket_to_addrs,
+            key=lambda socket_id: len(self.nvme_socket_to_addrs[socket_id]))
         min_ssd = len(self.nvme_socket_to_addrs[shortest_id])
         self.log.info("Maximum --min-ssds threshold = %d", min_ssd)
 
@@ -385,9 +546,10 @@ class ConfigGenerateOutput(TestWithServers):
         errors = []
 
         # Call dmg config generate --min-ssds=<1 to min_ssd>. Should pass.
-        for num_ssd in range(1, min_ssd + 1):
-            result = dmg.config_generate(
-                access_points="wolf-a", min_ssds=num_ssd)
+        ssds_range = self.get_valid_range(min_ssd)
+        results = self.config_generate_parallel(
+            [{"min_ssds": num_ssd} for num_ssd in ssds_range])
+        for num_ssd, result in zip(ssds_range, results):
             if result.exit_status != 0:
                 errors.append(
                     "config generate failed with min_ssd = {}!".format(num_ssd))
@@ -420,13 +582,13 @@ class ConfigGenerateOutput(TestWithServers):
         2. Call dmg config generate --net-class=infiniband
         --num-engines=<1 to ib_count> and verify that it works.
         3. In addition, verify provider using the dictionary. i.e., iterate
-        "engines" fields and verify "provider" is in the list where key is
+        "engines" fields and verify "provider" is in the set where key is
         "fabric_iface".
         4. Similarly find eth_count and call dmg config generate
         --net-class=ethernet --num-engines=<1 to eth_count> and verify that it
         works.
         5. As in ib, also verify provider using the dictionary. i.e., iterate
-        "engines" fields and verify "provider" is in the list where key is
+        "engines" fields and verify "provider" is in the set where key is
         "fabric_iface".
 
         :avocado: tags=all,full_regression
@@ -437,103 +599,18 @@ class ConfigGenerateOutput(TestWithServers):
         self.prepare_expected_data()
 
         # Get ib_count threshold.
-        ib_count = 0
-        for interface in self.interface_set:
-            if interface[:2] == "ib":
-                ib_count += 1
+        ib_count = sum(
+            1 for interface in self.interface_set if interface.startswith("ib"))
         self.log.info("ib_count = %d", ib_count)
 
-        dmg = DmgCommand(self.bin)
-        dmg.exit_status_exception = False
-        errors = []
-
-        # Call dmg config generate --num-engines=<1 to ib_count>
-        # --net-class=infiniband. Should pass.
-        for num_engines in range(1, ib_count + 1):
-            # dmg config generate should pass.
-            result = dmg.config_generate(
-                access_points="wolf-a", num_engines=num_engines,
-                net_class="infiniband")
-
-            if result.exit_status != 0:
-                msg = "config generate failed with --net-class=infiniband "\
-                    "--num-engines = {}!".format(num_engines)
-                errors.append(msg)
-            else:
-                generated_config = yaml.safe_load(result.stdout)
-                for engine in generated_config["engines"]:
-                    fabric_iface = engine["fabric_iface"]
-                    provider = engine["provider"]
-                    # Verify fabric_iface field, e.g., ib0 by checking the
-                    # dictionary keys.
-                    if not self.interface_to_providers[fabric_iface]:
-                        errors.append(
-                            "Unexpected fabric_iface! {}".format(fabric_iface))
-                    elif provider not in \
-                        self.interface_to_providers[fabric_iface]:
-                        # Now check the provider field, e.g., ofi+sockets by
-                        # checking the corresponding list in the dictionary.
-                        msg = "Unexpected provider in fabric_iface! provider ="\
-                            " {}; fabric_iface = {}".format(
-                                provider, fabric_iface)
-                        errors.append(msg)
-
-        # Call dmg config generate --num-engines=<ib_count + 1>
-        # --net-class=infiniband. Too many engines. Should fail.
-        result = dmg.config_generate(
-            access_points="wolf-a", num_engines=ib_count + 1,
-            net_class="infiniband")
-        if result.exit_status == 0:
-            msg = "config generate succeeded with --net-class=infiniband "\
-                "num_engines = {}!".format(ib_count + 1)
-            errors.append(msg)
-
         # Get eth_count threshold.
-        eth_count = 0
-        for interface in self.interface_set:
-            if interface[:3] == "eth":
-                eth_count += 1
+        eth_count = sum(
+            1 for interface in self.interface_set
+            if interface.startswith("eth"))
         self.log.info("eth_count = %d", eth_count)
 
-        # Call dmg config generate --num-engines=<1 to eth_count>
-        # --net-class=ethernet. Should pass.
-        for num_engines in range(1, eth_count + 1):
-            # dmg config generate should pass.
-            result = dmg.config_generate(
-                access_points="wolf-a", num_engines=num_engines,
-                net_class="ethernet")
-
-            if result.exit_status != 0:
-                msg = "config generate failed with --net-class=ethernet "\
-                    "--num-engines = {}!".format(num_engines)
-                errors.append(msg)
-            else:
-                generated_config = yaml.safe_load(result.stdout)
-                for engine in generated_config["engines"]:
-                    fabric_iface = engine["fabric_iface"]
-                    provider = engine["provider"]
-                    # Verify fabric_iface field, e.g., eth0 by checking the
-                    # dictionary keys.
-                    if not self.interface_to_providers[fabric_iface]:
-                        errors.append(
-                            "Unexpected fabric_iface! {}".format(fabric_iface))
-                    elif provider not in \
-                        self.interface_to_providers[fabric_iface]:
-                        # Now check the provider field, e.g., ofi+sockets by
-                        # checking the corresponding list in the dictionary.
-                        msg = "Unexpected provider in fabric_iface! provider ="\
-                            " {}; fabric_iface = {}".format(
-                                provider, fabric_iface)
-                        errors.append(msg)
-
-        # Call dmg config generate --num-engines=<eth_count + 1>
-        # --net-class=ethernet. Too many engines. Should fail.
-        result = dmg.config_generate(
-            access_points="wolf-a", num_engines=eth_count + 1,
-            net_class="ethernet")
-        if result.exit_status == 0:
-            msg = "config generate succeeded with --net-class=ethernet, "\
-                "num_engines = {}!".format(eth_count + 1)
-            errors.append(msg)
+        errors = []
+        errors.extend(self.verify_net_class("infiniband", ib_count))
+        errors.extend(self.verify_net_class("ethernet", eth_count))
 
         self.check_errors(errors)
@@ -46,8 +46,7 @@ class DmvrCopyProcs(DataMoverTestBase):
         """
         # Create pool and containers
         pool1 = self.create_pool()
-        cont1 = self.create_cont(pool1)
-        cont2 = self.create_cont(pool1)
+        cont1, cont2 = self.create_conts(pool1, 2)
 
         # Get the varying number of processes
         procs_list = self.params.get(
@@ -62,18 +62,20 @@ class DmvrPosixSymlinks(DataMoverTestBase):
         # Create a special container to hold UNS entries
         uns_cont = self.create_cont(pool1)
 
+        # Create a container for each type of links
+        container1, container2, container3 = self.create_conts(
+            pool1, 3, use_dfuse_uns=True, dfuse_uns_pool=pool1,
+            dfuse_uns_cont=uns_cont)
+
         # Test links that point forward
-        container1 = self.create_cont(pool1, True, pool1, uns_cont)
         self.run_dm_posix_symlinks_fun(
             pool1, container1, self.create_links_forward, "forward")
 
         # Test links that point backward
-        container2 = self.create_cont(pool1, True, pool1, uns_cont)
         self.run_dm_posix_symlinks_fun(
             pool1, container2, self.create_links_backward, "backward")
 
         # Test a mix of forward and backward links
-        container3 = self.create_cont(pool1, True, pool1, uns_cont)
         self.run_dm_posix_symlinks_fun(
             pool1, container3, self.create_links_mixed, "mixed")
 
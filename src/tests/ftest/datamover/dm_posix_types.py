@@ -73,8 +73,9 @@ class DmvrPosixTypesTest(DataMoverTestBase):
         uns_cont = self.create_cont(pool1)
 
         # Create all other containers
-        container1 = self.create_cont(pool1, True, pool1, uns_cont)
-        container2 = self.create_cont(pool1, True, pool1, uns_cont)
+        container1, container2 = self.create_conts(
+            pool1, 2, use_dfuse_uns=True, dfuse_uns_pool=pool1,
+            dfuse_uns_cont=uns_cont)
         container3 = self.create_cont(pool2, True, pool1, uns_cont)
 
         # Create each source location
@@ -207,7 +207,7 @@ class DaosAgentManager(SubprocessManager):
 
         # Update the expected number of messages to reflect the number of
         # daos_agent processes that will be started by the command
-        self.manager.job.pattern_count = len(self._hosts)
+        self.manager.job.pattern_count = self._host_qty
 
     def start(self):
         """Start the agent through the job manager."""
@@ -631,7 +631,8 @@ class SubProcessCommand(CommandWithSubCommand):
 
             # Summarize results
             msg = "{}/{} '{}' messages detected in".format(
-                detected, self.pattern_count, self.pattern)
+                detected, self.pattern_count,
+                getattr(self.pattern, "pattern", self.pattern))
             runtime = "{}/{} seconds".format(
                 time.time() - start, self.pattern_timeout.value)
 
@@ -917,6 +918,8 @@ class SubprocessManager():
 
         # Define the list of hosts that will execute the daos command
         self._hosts = []
+        self._hosts_set = frozenset()
+        self._host_qty = 0
 
         # The socket directory verification is not required with systemctl
         self._verify_socket_dir = manager != "Systemctl"
@@ -978,8 +981,10 @@ class SubprocessManager():
             slots (int): number of slots per host to specify in the hostfile
         """
         self._hosts = list(hosts)
+        self._hosts_set = frozenset(self._hosts)
+        self._host_qty = len(self._hosts)
         self.manager.assign_hosts(self._hosts, path, slots)
-        self.manager.assign_processes(len(self._hosts))
+        self.manager.assign_processes(self._host_qty)
 
     def get_params(self, test):
         """Get values for all of the command params from the yaml file.
@@ -8,6 +8,10 @@ from logging import getLogger
 import os
 import yaml
 
+# Use the libyaml based emitters when PyYAML has been built with them
+YAML_DUMPER = getattr(yaml, "CDumper", yaml.Dumper)
+YAML_SAFE_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 class CommandFailure(Exception):
     """Base exception for this module."""
@@ -305,6 +309,15 @@ class ObjectWithParameters():
         for name in self.get_param_names():
             getattr(self, name).get_yaml_value(name, test, self.namespace)
 
+    def bulk_reset(self, names):
+        """Reset the values of multiple parameters to None.
+
+        Args:
+            names (iterable): names of the BasicParameter attributes to reset
+        """
+        for name in names:
+            getattr(self, name).value = None
+
 
 class CommandWithParameters(ObjectWithParameters):
     """A class for command with parameters."""
@@ -472,7 +485,9 @@ class YamlParameters(ObjectWithParameters):
             self.log.info("Writing yaml configuration file %s", filename)
             try:
                 with open(filename, 'w') as write_file:
-                    yaml.dump(yaml_data, write_file, default_flow_style=False)
+                    yaml.dump(
+                        yaml_data, write_file, Dumper=YAML_DUMPER,
+                        default_flow_style=False)
             except Exception as error:
                 raise CommandFailure(
                     "Error writing the yaml file {}: {}".format(
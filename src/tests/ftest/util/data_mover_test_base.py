@@ -13,7 +13,13 @@ from mdtest_test_base import MdtestBase
 from data_mover_utils import DcpCommand, DsyncCommand, FsCopy, ContClone
 from data_mover_utils import DserializeCommand, DdeserializeCommand
 from data_mover_utils import format_daos_path, uuid_from_obj
+from concurrent.futures import ThreadPoolExecutor
 from os.path import join
+from socket import gethostname
+import filecmp
+import os
+import shlex
+import shutil
 import uuid
 import re
 import ctypes
@@ -46,16 +52,23 @@ class DataMoverTestBase(IorTestBase, MdtestBase):
     """
 
     # The valid parameter types for setting params.
-    PARAM_TYPES = ("POSIX", "DAOS_UUID", "DAOS_UNS")
+    PARAM_TYPES = frozenset(("POSIX", "DAOS_UUID", "DAOS_UNS"))
+
+    # Shorthand parameter types and the parameter type they represent.
+    PARAM_TYPE_ALIASES = {"DAOS": "DAOS_UUID"}
 
     # The valid datamover tools that can be used
-    TOOLS = (
+    TOOLS = frozenset((
         "DCP",       # mpifileutils dcp
         "DSYNC",     # mpifileutils dsync
         "DSERIAL",   # mpifileutils daos-serialize + daos-deserialize
         "FS_COPY",   # daos filesystem copy
         "CONT_CLONE" # daos container clone
-    )
+    ))
+
+    # Pattern used to parse the uuid of a newly created container
+    CONT_UUID_PATTERN = re.compile(
+        r"Successfully created container (\S{8}-\S{4}-\S{4}-\S{4}-\S{12})")
 
     def __init__(self, *args, **kwargs):
         """Initialize a DataMoverTestBase object."""
@@ -77,6 +90,7 @@ class DataMoverTestBase(IorTestBase, MdtestBase):
         self.pool = []
         self.container = []
         self.uuids = []
+        self.uuid_set = set()
         self.dfuse_hosts = None
         self.num_run_datamover = 0  # Number of times run_datamover was called
 
@@ -86,9 +100,42 @@ class DataMoverTestBase(IorTestBase, MdtestBase):
         # List of test paths to create and remove
         self.posix_test_paths = []
 
+        # Number of posix test paths and their quoted string
+        self._posix_test_path_string = (0, "")
+
         # List of daos test paths to keep track of
         self.daos_test_paths = []
 
+        # Method used by set_datamover_params for each tool
+        self._param_dispatch = {
+            "DCP": self._set_dcp_params,
+            "DSYNC": self._set_dsync_params,
+            "DSERIAL": self._set_dserial_datamover_params,
+            "FS_COPY": self._set_fs_copy_params,
+            "CONT_CLONE": self._set_cont_clone_datamover_params
+        }
+
+        # Method used by run_datamover for each tool
+        self._tool_dispatch = {
+            "DCP": self._run_dcp,
+            "DSYNC": self._run_dsync,
+            "DSERIAL": self._run_dserial,
+            "FS_COPY": self._run_fs_copy,
+            "CONT_CLONE": self._run_cont_clone
+        }
+
+        # Param setter, runner, job manager getter, and processes attribute
+        # used by _run_workload for each workload
+        self._workloads = {
+            "ior": (
+                self.set_ior_params, self.run_ior,
+                self.get_ior_job_manager_command, "ior_processes"),
+            "mdtest": (
+                self.set_mdtest_params, self.run_mdtest,
+                lambda: self.get_mdtest_job_manager_command(self.manager),
+                "mdtest_processes")
+        }
+
     def setUp(self):
         """Set up each test case."""
         # Start the servers and agents
@@ -128,7 +175,18 @@ class DataMoverTestBase(IorTestBase, MdtestBase):
         """
         error_list = []
         # Remove the created directories
-        if self.posix_test_paths:
+        if self.posix_test_paths and self._clients_are_local():
+            # Avoid running a remote shell when the paths are on this host
+            for path in self.posix_test_paths:
+                try:
+                    if os.path.isdir(path) and not os.path.islink(path):
+                        shutil.rmtree(path)
+                    elif os.path.lexists(path):
+                        os.remove(path)
+                except OSError as error:
+                    error_list.append(
+                        "Error removing created directories: {}".format(error))
+        elif self.posix_test_paths:
             command = "rm -rf {}".format(self._get_posix_test_path_string())
             try:
                 self._execute_command(command)
@@ -137,6 +195,19 @@ class DataMoverTestBase(IorTestBase, MdtestBase):
                     "Error removing created directories: {}".format(error))
         return error_list
 
+    def _clients_are_local(self):
+        """Determine if this host is the only client host.
+
+        Returns:
+            bool: True if the client hosts only include this host
+
+        """
+        if not self.hostlist_clients:
+            return False
+        local_host = gethostname().split(".")[0]
+        return {
+            host.split(".")[0] for host in self.hostlist_clients} == {local_host}
+
     def set_tool(self, tool):
         """Set the copy tool.
 
@@ -146,30 +217,27 @@ class DataMoverTestBase(IorTestBase, MdtestBase):
             tool (str): the tool to use. Must be in self.TOOLS
 
         """
-        _tool = str(tool).upper()
+        _tool = tool.upper() if isinstance(tool, str) else str(tool).upper()
         if _tool in self.TOOLS:
             self.log.info("DataMover tool = %s", _tool)
             self.tool = _tool
         else:
             self.fail("Invalid tool: {}".format(_tool))
 
-    def _get_posix_test_path_list(self):
-        """Get a list of quoted posix test path strings.
-
-        Returns:
-            list: a list of quoted posix test path strings
-
-        """
-        return ["'{}'".format(item) for item in self.posix_test_paths]
-
     def _get_posix_test_path_string(self):
         """Get a string of all of the quoted posix test path strings.
 
+        The string is rebuilt only when posix test paths have been added.
+
         Returns:
             str: a string of all of the quoted posix test path strings
 
         """
-        return " ".join(self._get_posix_test_path_list())
+        if self._posix_test_path_string[0] != len(self.posix_test_paths):
+            self._posix_test_path_string = (
+                len(self.posix_test_paths),
+                " ".join(shlex.quote(item) for item in self.posix_test_paths))
+        return self._posix_test_path_string[1]
 
     def new_posix_test_path(self, create=True, parent=None):
         """Generate a new, unique posix path.
@@ -196,8 +264,7 @@ class DataMoverTestBase(IorTestBase, MdtestBase):
 
         if create:
             # Create the directory
-            cmd = "mkdir -p '{}'".format(path)
-            self.execute_cmd(cmd)
+            self._make_dirs(path)
 
         return path
 
@@ -226,11 +293,26 @@ class DataMoverTestBase(IorTestBase, MdtestBase):
             if not cont or not cont.path:
                 self.fail("Container path required to create directory.")
             # Create the directory relative to the container path
-            cmd = "mkdir -p '{}'".format(cont.path.value + path)
-            self.execute_cmd(cmd)
+            self._make_dirs(cont.path.value + path)
 
         return path
 
+    def _make_dirs(self, path):
+        """Create a directory and its parents on the client hosts.
+
+        Args:
+            path (str): the directory to create.
+
+        """
+        if self._clients_are_local():
+            # Avoid running a remote shell when the path is on this host
+            try:
+                os.makedirs(path, exist_ok=True)
+            except OSError as error:
+                self.fail("Error creating {}: {}".format(path, error))
+        else:
+            self.execute_cmd("mkdir -p {}".format(shlex.quote(path)))
+
     def _validate_param_type(self, param_type):
         """Validates the param_type.
 
@@ -243,9 +325,11 @@ class DataMoverTestBase(IorTestBase, MdtestBase):
             str: A valid param_type
 
         """
-        _type = str(param_type).upper()
-        if _type == "DAOS":
-            return "DAOS_UUID"
+        if isinstance(param_type, str):
+            _type = param_type.upper()
+        else:
+            _type = str(param_type).upper()
+        _type = self.PARAM_TYPE_ALIASES.get(_type, _type)
         if _type in self.PARAM_TYPES:
             return _type
         self.fail("Invalid param_type: {}".format(_type))
@@ -262,7 +346,7 @@ class DataMoverTestBase(IorTestBase, MdtestBase):
 
         # Save the pool and uuid
         self.pool.append(pool)
-        self.uuids.append(str(pool.uuid))
+        self._track_uuid(pool.uuid)
 
         return pool
 
@@ -295,28 +379,83 @@ class DataMoverTestBase(IorTestBase, MdtestBase):
             dfuse_uns_pool and dfuse_uns_cont should only be supplied
             when dfuse was not started for a specific pool/container.
 
+        """
+        container = self._init_cont(
+            pool, len(self.container), use_dfuse_uns, dfuse_uns_pool,
+            dfuse_uns_cont, cont_type)
+
+        # Create container
+        container.create()
+
+        # Save container and uuid
+        self._track_container(container)
+
+        return container
+
+    def create_conts(self, pool, count, max_workers=16, **kwargs):
+        """Create multiple TestContainer objects concurrently.
+
+        The containers are defined in order, created in parallel, and then
+        saved in order.
+
+        Args:
+            pool (TestPool): pool to create the containers in.
+            count (int): number of containers to create.
+            max_workers (int, optional): maximum number of containers to
+                create at once. Defaults to 16.
+            kwargs (dict): see create_cont
+
+        Returns:
+            list: the TestContainer objects
+
+        """
+        containers = [
+            self._init_cont(pool, len(self.container) + index, **kwargs)
+            for index in range(count)]
+
+        if containers:
+            with ThreadPoolExecutor(
+                    max_workers=min(count, max_workers)) as executor:
+                # Consume the results to raise any creation exception
+                list(executor.map(
+                    lambda container: container.create(), containers))
+
+        # Save containers and uuids
+        for container in containers:
+            self._track_container(container)
+
+        return containers
+
+    def _init_cont(self, pool, index, use_dfuse_uns=False,
+                   dfuse_uns_pool=None, dfuse_uns_cont=None, cont_type=None):
+        """Define a TestContainer object without creating it.
+
+        Args:
+            pool (TestPool): pool to create the container in.
+            index (int): index of the container, used to name its UNS path.
+            use_dfuse_uns: see create_cont
+            dfuse_uns_pool: see create_cont
+            dfuse_uns_cont: see create_cont
+            cont_type: see create_cont
+
+        Returns:
+            TestContainer: the container object
+
         """
         container = self.get_container(pool, create=False)
 
         if use_dfuse_uns:
-            path = str(self.dfuse.mount_dir.value)
+            path_parts = [str(self.dfuse.mount_dir.value)]
             if dfuse_uns_pool:
-                path = join(path, dfuse_uns_pool.uuid)
+                path_parts.append(dfuse_uns_pool.uuid)
             if dfuse_uns_cont:
-                path = join(path, dfuse_uns_cont.uuid)
-            path = join(path, "uns{}".format(str(len(self.container))))
-            container.path.update(path)
+                path_parts.append(dfuse_uns_cont.uuid)
+            path_parts.append("uns{}".format(index))
+            container.path.update(join(*path_parts))
 
         if cont_type:
             container.type.update(cont_type)
 
-        # Create container
-        container.create()
-
-        # Save container and uuid
-        self.container.append(container)
-        self.uuids.append(str(container.uuid))
-
         return container
 
     def get_cont(self, pool, cont_uuid):
@@ -341,11 +480,32 @@ class DataMoverTestBase(IorTestBase, MdtestBase):
         container.container.poh = pool.pool.handle
 
         # Save container and uuid
-        self.container.append(container)
-        self.uuids.append(str(container.uuid))
+        self._track_container(container)
 
         return container
 
+    def _track_container(self, container):
+        """Save a container and its uuid.
+
+        Args:
+            container (TestContainer): the container to save.
+
+        """
+        self.container.append(container)
+        self._track_uuid(container.uuid)
+
+    def _track_uuid(self, new_uuid):
+        """Save a pool or container uuid.
+
+        Args:
+            new_uuid (object): the uuid to save.
+
+        """
+        if not isinstance(new_uuid, str):
+            new_uuid = str(new_uuid)
+        self.uuids.append(new_uuid)
+        self.uuid_set.add(new_uuid)
+
     def gen_uuid(self):
         """Generate a unique uuid.
 
@@ -353,16 +513,16 @@ class DataMoverTestBase(IorTestBase, MdtestBase):
             str: a unique uuid
 
         """
-        new_uuid = str(uuid.uuid4())
-        while new_uuid in self.uuids:
-            new_uuid = str(uuid.uuid4())
+        new_uuid = str(uuid.UUID(bytes=os.urandom(16), version=4))
+        while new_uuid in self.uuid_set:
+            new_uuid = str(uuid.UUID(bytes=os.urandom(16), version=4))
         return new_uuid
 
     def parse_create_cont_uuid(self, output):
         """Parse a uuid from some output.
 
         Format:
-            Successfully created container (.*-.*-.*-.*-.*)
+            Successfully created container <uuid>
 
         Args:
             output (str): The string to parse for the uuid.
@@ -371,19 +531,45 @@ class DataMoverTestBase(IorTestBase, MdtestBase):
             str: The parsed uuid.
 
         """
-        uuid_search = re.search(
-            r"Successfully created container (.*-.*-.*-.*-.*)",
-            output)
+        uuid_search = self.CONT_UUID_PATTERN.search(output)
         if not uuid_search:
             self.fail("Failed to parse container uuid")
         return uuid_search.group(1)
 
+    @staticmethod
+    def _get_dataset_keys(num_dkeys, num_akeys_single, num_akeys_array):
+        """Get the dkey and akey buffers used by dataset_gen/dataset_verify.
+
+        Args:
+            num_dkeys (int): number of dkeys per object.
+            num_akeys_single (int): number of DAOS_IOD_SINGLE akeys per dkey.
+            num_akeys_array (int): number of DAOS_IOD_ARRAY akeys per dkey.
+
+        Returns:
+            tuple: lists of the dkey, single akey, and array akey buffers.
+
+        """
+        c_dkeys = [
+            create_string_buffer("dkey {}".format(dkey_idx))
+            for dkey_idx in range(num_dkeys)]
+        c_akeys_single = [
+            create_string_buffer("akey single {}".format(akey_idx))
+            for akey_idx in range(num_akeys_single)]
+        c_akeys_array = [
+            create_string_buffer("akey array {}".format(akey_idx))
+            for akey_idx in range(num_akeys_array)]
+        return c_dkeys, c_akeys_single, c_akeys_array
+
     def dataset_gen(self, cont, num_objs, num_dkeys, num_akeys_single,
-                    num_akeys_array, akey_sizes, akey_extents):
+                    num_akeys_array, akey_sizes, akey_extents, max_workers=8):
+        # pylint: disable=too-many-locals
         """Generate a dataset with some number of objects, dkeys, and akeys.
 
         Expects the container to be created with the API control method.
 
+        The objects are created in order, then their data is written by up to
+        max_workers threads so that the updates of different objects overlap.
+
         Args:
             cont (TestContainer): the container.
             num_objs (int): number of objects to create in the container.
@@ -392,6 +578,8 @@ class DataMoverTestBase(IorTestBase, MdtestBase):
             num_akeys_array (int): number of DAOS_IOD_ARRAY akeys per dkey.
             akey_sizes (list): varying akey sizes to iterate.
             akey_extents (list): varying number of akey extents to iterate.
+            max_workers (int, optional): maximum number of objects to write
+                at once. Defaults to 8.
 
         Returns:
             list: a list of DaosObj created.
@@ -404,50 +592,78 @@ class DataMoverTestBase(IorTestBase, MdtestBase):
 
         obj_list = []
 
+        # Create the dkey and akey buffers once, as they are the same for
+        # every object
+        c_dkeys, c_akeys_single, c_akeys_array = self._get_dataset_keys(
+            num_dkeys, num_akeys_single, num_akeys_array)
+
+        # Create the data buffers for each akey size filled with each number
+        # 0-9 once, as the same data is written for many akeys
+        buf_cache = {}
+        size_cache = {}
+        for akey_size_idx, data_size in enumerate(akey_sizes):
+            for data_val in range(10):
+                buf_cache[(akey_size_idx, data_val)] = create_string_buffer(
+                    data_size * str(data_val))
+            # Single values are written with their terminating null byte
+            size_cache[akey_size_idx] = ctypes.c_size_t(data_size + 1)
+
+        # The akeys and their data are the same for every dkey, so build the
+        # arguments of each insert once
+        single_args = []
+        for akey_idx in range(num_akeys_single):
+            # Round-robin to get the size of data and
+            # arbitrarily use a number 0-9 to fill data
+            akey_size_idx = akey_idx % len(akey_sizes)
+            single_args.append((
+                c_akeys_single[akey_idx],
+                buf_cache[(akey_size_idx, akey_idx % 10)],
+                size_cache[akey_size_idx]))
+        array_args = []
+        for akey_idx in range(num_akeys_array):
+            # Round-robin to get the size of data and
+            # the number of extents, and
+            # arbitrarily use a number 0-9 to fill data
+            akey_size_idx = akey_idx % len(akey_sizes)
+            data_size = akey_sizes[akey_size_idx]
+            akey_extent_idx = akey_idx % len(akey_extents)
+            num_extents = akey_extents[akey_extent_idx]
+            c_data = []
+            for data_idx in range(num_extents):
+                c_data.append([
+                    buf_cache[(akey_size_idx, data_idx % 10)], data_size])
+            array_args.append((c_akeys_array[akey_idx], c_data))
+        has_akeys = bool(single_args or array_args)
+
+        def _write_obj(obj):
+            """Write the dataset to an object with its own IORequest."""
+            obj.open()
+            try:
+                ioreq = IORequest(cont.pool.context, cont.container, obj)
+                single_insert = ioreq.single_insert
+                insert_array = ioreq.insert_array
+                # Without any akeys there is nothing to write under the dkeys
+                for c_dkey in c_dkeys if has_akeys else ():
+                    for c_akey, c_data, c_size in single_args:
+                        single_insert(c_dkey, c_akey, c_data, c_size)
+
+                    for c_akey, c_data in array_args:
+                        insert_array(c_dkey, c_akey, c_data)
+            finally:
+                obj.close()
+
+        # Generate the object ids serially, as the oid generator is not
+        # thread-safe
         for obj_idx in range(num_objs):
-            # Open the obj
             obj = DaosObj(cont.pool.context, cont.container)
             obj_list.append(obj)
             obj.create(rank=obj_idx, objcls=2)
-            obj.open()
-
-            ioreq = IORequest(cont.pool.context, cont.container, obj)
-            for dkey_idx in range(num_dkeys):
-                dkey = "dkey {}".format(dkey_idx)
-                c_dkey = create_string_buffer(dkey)
-
-                for akey_idx in range(num_akeys_single):
-                    # Round-robin to get the size of data and
-                    # arbitrarily use a number 0-9 to fill data
-                    akey_size_idx = akey_idx % len(akey_sizes)
-                    data_size = akey_sizes[akey_size_idx]
-                    data_val = str(akey_idx % 10)
-                    data = data_size * data_val
-                    akey = "akey single {}".format(akey_idx)
-                    c_akey = create_string_buffer(akey)
-                    c_data = create_string_buffer(data)
-                    c_size = ctypes.c_size_t(ctypes.sizeof(c_data))
-                    ioreq.single_insert(c_dkey, c_akey, c_data, c_size)
 
-                for akey_idx in range(num_akeys_array):
-                    # Round-robin to get the size of data and
-                    # the number of extents, and
-                    # arbitrarily use a number 0-9 to fill data
-                    akey_size_idx = akey_idx % len(akey_sizes)
-                    data_size = akey_sizes[akey_size_idx]
-                    akey_extent_idx = akey_idx % len(akey_extents)
-                    num_extents = akey_extents[akey_extent_idx]
-                    akey = "akey array {}".format(akey_idx)
-                    c_akey = create_string_buffer(akey)
-                    c_data = []
-                    for data_idx in range(num_extents):
-                        data_val = str(data_idx % 10)
-                        data = data_size * data_val
-                        c_data.append([
-                            create_string_buffer(data), data_size])
-                    ioreq.insert_array(c_dkey, c_akey, c_data)
-
-            obj.close()
+        if obj_list:
+            with ThreadPoolExecutor(
+                    max_workers=min(num_objs, max_workers)) as executor:
+                # Consume the results to raise any write exception
+                list(executor.map(_write_obj, obj_list))
         cont.close()
 
         return obj_list
@@ -474,6 +690,28 @@ class DataMoverTestBase(IorTestBase, MdtestBase):
 
         cont.open()
 
+        # Create the dkey and akey buffers once, as they are the same for
+        # every object
+        c_dkeys, c_akeys_single, c_akeys_array = self._get_dataset_keys(
+            num_dkeys, num_akeys_single, num_akeys_array)
+
+        # Create the expected data for each akey size filled with each number
+        # 0-9 once, as bytes to compare directly with the fetched data
+        expected_cache = {}
+        for akey_size_idx, data_size in enumerate(akey_sizes):
+            for data_val in range(10):
+                expected_cache[(akey_size_idx, data_val)] = (
+                    data_size * str(data_val)).encode()
+
+        # The number of extents and the extent size of each array akey
+        array_sizes = []
+        for akey_idx in range(num_akeys_array):
+            data_size = akey_sizes[akey_idx % len(akey_sizes)]
+            num_extents = akey_extents[akey_idx % len(akey_extents)]
+            array_sizes.append(
+                (ctypes.c_uint(num_extents), ctypes.c_size_t(data_size)))
+        has_akeys = bool(num_akeys_single or num_akeys_array)
+
         for obj_idx in range(num_objs):
             # Open the obj
             c_oid = obj_list[obj_idx].c_oid
@@ -481,30 +719,30 @@ class DataMoverTestBase(IorTestBase, MdtestBase):
             obj.open()
 
             ioreq = IORequest(cont.pool.context, cont.container, obj)
-            for dkey_idx in range(num_dkeys):
-                dkey = "dkey {}".format(dkey_idx)
-                c_dkey = create_string_buffer(dkey)
+            single_fetch = ioreq.single_fetch
+            fetch_array = ioreq.fetch_array
+            # Without any akeys there is nothing to read under the dkeys
+            for dkey_idx in range(num_dkeys if has_akeys else 0):
+                c_dkey = c_dkeys[dkey_idx]
 
                 for akey_idx in range(num_akeys_single):
                     # Round-robin to get the size of data and
                     # arbitrarily use a number 0-9 to fill data
                     akey_size_idx = akey_idx % len(akey_sizes)
                     data_size = akey_sizes[akey_size_idx]
-                    data_val = str(akey_idx % 10)
-                    data = data_size * data_val
-                    akey = "akey single {}".format(akey_idx)
-                    c_akey = create_string_buffer(akey)
-                    c_data = ioreq.single_fetch(c_dkey, c_akey,
-                                                data_size + 1)
-                    actual_data = str(c_data.value.decode())
+                    data = expected_cache[(akey_size_idx, akey_idx % 10)]
+                    c_akey = c_akeys_single[akey_idx]
+                    c_data = single_fetch(c_dkey, c_akey, data_size + 1)
+                    actual_data = c_data.value
                     if actual_data != data:
                         self.log.info("Expected:\n%s\nBut got:\n%s",
-                            data[:100] + "...",
-                            actual_data[:100] + "...")
+                            data[:100].decode() + "...",
+                            actual_data[:100].decode() + "...")
                         self.log.info(
                             "For:\nobj: %s.%s\ndkey: %s\nakey: %s",
                             str(obj.c_oid.hi), str(obj.c_oid.lo),
-                            dkey, akey)
+                            "dkey {}".format(dkey_idx),
+                            "akey single {}".format(akey_idx))
                         self.fail("Single value verification failed.")
 
                 for akey_idx in range(num_akeys_array):
@@ -515,24 +753,22 @@ class DataMoverTestBase(IorTestBase, MdtestBase):
                     data_size = akey_sizes[akey_size_idx]
                     akey_extent_idx = akey_idx % len(akey_extents)
                     num_extents = akey_extents[akey_extent_idx]
-                    akey = "akey array {}".format(akey_idx)
-                    c_akey = create_string_buffer(akey)
-                    c_num_extents = ctypes.c_uint(num_extents)
-                    c_data_size = ctypes.c_size_t(data_size)
-                    actual_data = ioreq.fetch_array(c_dkey, c_akey,
+                    c_akey = c_akeys_array[akey_idx]
+                    c_num_extents, c_data_size = array_sizes[akey_idx]
+                    actual_data = fetch_array(c_dkey, c_akey,
                         c_num_extents, c_data_size)
                     for data_idx in range(num_extents):
-                        data_val = str(data_idx % 10)
-                        data = data_size * data_val
-                        actual_idx = str(actual_data[data_idx].decode())
+                        data = expected_cache[(akey_size_idx, data_idx % 10)]
+                        actual_idx = actual_data[data_idx]
                         if data != actual_idx:
                             self.log.info("Expected:\n%s\nBut got:\n%s",
-                                data[:100] + "...",
-                                actual_idx + "...")
+                                data[:100].decode() + "...",
+                                actual_idx.decode() + "...")
                             self.log.info(
                                 "For:\nobj: %s.%s\ndkey: %s\nakey: %s",
                                     str(obj.c_oid.hi), str(obj.c_oid.lo),
-                                    dkey, akey)
+                                    "dkey {}".format(dkey_idx),
+                                    "akey array {}".format(akey_idx))
                             self.fail("Array verification failed.")
 
             obj.close()
@@ -559,31 +795,11 @@ class DataMoverTestBase(IorTestBase, MdtestBase):
             dst_cont (TestContainer, optional): the destination cont or uuid.
 
         """
-        if self.tool == "DCP":
-            self._set_dcp_params(src_type, src_path, src_pool, src_cont,
-                                 dst_type, dst_path, dst_pool, dst_cont)
-        elif self.tool == "DSYNC":
-            self._set_dsync_params(src_type, src_path, src_pool, src_cont,
-                                   dst_type, dst_path, dst_pool, dst_cont)
-        elif self.tool == "DSERIAL":
-            assert src_type in (None, "DAOS", "DAOS_UUID") #nosec
-            assert src_path is None #nosec
-            assert dst_type in (None, "DAOS", "DAOS_UUID") #nosec
-            assert dst_path is None #nosec
-            assert dst_cont is None #nosec
-            self._set_dserial_params(src_pool, src_cont, dst_pool)
-        elif self.tool == "FS_COPY":
-            self._set_fs_copy_params(src_type, src_path, src_pool, src_cont,
-                                     dst_type, dst_path, dst_pool, dst_cont)
-        elif self.tool == "CONT_CLONE":
-            assert src_type in (None, "DAOS", "DAOS_UUID") # nosec
-            assert src_path is None # nosec
-            assert dst_type in (None, "DAOS", "DAOS_UUID") # nosec
-            assert dst_path is None # nosec
-            self._set_cont_clone_params(src_pool, src_cont,
-                                        dst_pool, dst_cont)
-        else:
+        set_params = self._param_dispatch.get(self.tool)
+        if set_params is None:
             self.fail("Invalid tool: {}".format(str(self.tool)))
+        set_params(src_type, src_path, src_pool, src_cont,
+                   dst_type, dst_path, dst_pool, dst_cont)
 
     def _set_dcp_params(self,
                         src_type=None, src_path=None,
@@ -619,9 +835,12 @@ class DataMoverTestBase(IorTestBase, MdtestBase):
         if not dst_type and (dst_path or dst_pool or dst_cont):
             self.fail("dst params require dst_type")
 
-        # First, initialize a new dcp command
-        self.dcp_cmd = DcpCommand(self.hostlist_clients, self.workdir)
-        self.dcp_cmd.get_params(self)
+        # First, initialize the dcp command once or reset its paths
+        if self.dcp_cmd is None:
+            self.dcp_cmd = DcpCommand(self.hostlist_clients, self.workdir)
+            self.dcp_cmd.get_params(self)
+        else:
+            self._reset_mfu_paths(self.dcp_cmd)
 
         # Set the source params
         if src_type == "POSIX":
@@ -632,13 +851,8 @@ class DataMoverTestBase(IorTestBase, MdtestBase):
                 src_path=format_daos_path(src_pool, src_cont, src_path))
         elif src_type == "DAOS_UNS":
             if src_cont:
-                if src_path == "/":
-                    self.dcp_cmd.set_params(
-                        src_path=src_cont.path.value)
-                else:
-                    self.dcp_cmd.set_params(
-                        daos_prefix=src_cont.path.value,
-                        src_path=src_cont.path.value + src_path)
+                self.dcp_cmd.set_params(
+                    **self._get_uns_params(src_cont, src_path, "src"))
 
         # Set the destination params
         if dst_type == "POSIX":
@@ -649,13 +863,41 @@ class DataMoverTestBase(IorTestBase, MdtestBase):
                 dst_path=format_daos_path(dst_pool, dst_cont, dst_path))
         elif dst_type == "DAOS_UNS":
             if dst_cont:
-                if dst_path == "/":
-                    self.dcp_cmd.set_params(
-                        dst_path=dst_cont.path.value)
-                else:
-                    self.dcp_cmd.set_params(
-                        daos_prefix=dst_cont.path.value,
-                        dst_path=dst_cont.path.value + dst_path)
+                self.dcp_cmd.set_params(
+                    **self._get_uns_params(dst_cont, dst_path, "dst"))
+
+    @staticmethod
+    def _get_uns_params(cont, path, side):
+        """Get the dcp or dsync params for a DAOS_UNS path.
+
+        Args:
+            cont (TestContainer): the container with a UNS path.
+            path (str): the path relative to the container root.
+            side (str): "src" or "dst".
+
+        Returns:
+            dict: the params to pass to set_params
+
+        """
+        cont_path = cont.path.value
+        if path == "/":
+            return {side + "_path": cont_path}
+        return {"daos_prefix": cont_path, side + "_path": cont_path + path}
+
+    @staticmethod
+    def _reset_mfu_paths(mfu_cmd):
+        """Reset the path params of a dcp or dsync command.
+
+        These are the params set by _set_dcp_params and _set_dsync_params, or
+        directly by tests, so they are cleared before reusing the command.
+
+        Args:
+            mfu_cmd (MfuCommandBase): the dcp or dsync command.
+
+        """
+        mfu_cmd.daos_prefix.update(None)
+        mfu_cmd.src_path.update(None)
+        mfu_cmd.dst_path.update(None)
 
     def _set_dsync_params(self,
                           src_type=None, src_path=None,
@@ -681,9 +923,12 @@ class DataMoverTestBase(IorTestBase, MdtestBase):
             dst_cont (TestContainer, optional): the destination cont or uuid.
 
         """
-        # First, initialize a new dsync command
-        self.dsync_cmd = DsyncCommand(self.hostlist_clients, self.workdir)
-        self.dsync_cmd.get_params(self)
+        # First, initialize the dsync command once or reset its paths
+        if self.dsync_cmd is None:
+            self.dsync_cmd = DsyncCommand(self.hostlist_clients, self.workdir)
+            self.dsync_cmd.get_params(self)
+        else:
+            self._reset_mfu_paths(self.dsync_cmd)
 
         # Set the source params
         if src_type == "POSIX":
@@ -694,13 +939,8 @@ class DataMoverTestBase(IorTestBase, MdtestBase):
                 src_path=format_daos_path(src_pool, src_cont, src_path))
         elif src_type == "DAOS_UNS":
             if src_cont:
-                if src_path == "/":
-                    self.dsync_cmd.set_params(
-                        src_path=src_cont.path.value)
-                else:
-                    self.dsync_cmd.set_params(
-                        daos_prefix=src_cont.path.value,
-                        src_path=src_cont.path.value + src_path)
+                self.dsync_cmd.set_params(
+                    **self._get_uns_params(src_cont, src_path, "src"))
 
         # Set the destination params
         if dst_type == "POSIX":
@@ -711,13 +951,8 @@ class DataMoverTestBase(IorTestBase, MdtestBase):
                 dst_path=format_daos_path(dst_pool, dst_cont, dst_path))
         elif dst_type == "DAOS_UNS":
             if dst_cont:
-                if dst_path == "/":
-                    self.dsync_cmd.set_params(
-                        dst_path=dst_cont.path.value)
-                else:
-                    self.dsync_cmd.set_params(
-                        daos_prefix=dst_cont.path.value,
-                        dst_path=dst_cont.path.value + dst_path)
+                self.dsync_cmd.set_params(
+                    **self._get_uns_params(dst_cont, dst_path, "dst"))
 
     def _set_fs_copy_params(self,
                             src_type=None, src_path=None,
@@ -752,8 +987,12 @@ class DataMoverTestBase(IorTestBase, MdtestBase):
         if not dst_type and (dst_path or dst_pool or dst_cont):
             self.fail("dst params require dst_type")
 
-        # First, initialize a new fs copy command
-        self.fs_copy_cmd = FsCopy(self.daos_cmd, self.log)
+        # First, initialize the fs copy command once or reset its paths
+        if self.fs_copy_cmd is None:
+            self.fs_copy_cmd = FsCopy(self.daos_cmd, self.log)
+        else:
+            self.fs_copy_cmd.src = None
+            self.fs_copy_cmd.dst = None
 
         # Set the source params
         if src_type == "POSIX":
@@ -789,6 +1028,23 @@ class DataMoverTestBase(IorTestBase, MdtestBase):
             self.fs_copy_cmd.set_fs_copy_params(
                 dst=path)
 
+    def _set_cont_clone_datamover_params(self,
+                                         src_type=None, src_path=None,
+                                         src_pool=None, src_cont=None,
+                                         dst_type=None, dst_path=None,
+                                         dst_pool=None, dst_cont=None):
+        """Set the params for daos cont clone from the datamover params.
+
+        Args:
+            see set_datamover_params
+
+        """
+        assert src_type in (None, "DAOS", "DAOS_UUID") # nosec
+        assert src_path is None # nosec
+        assert dst_type in (None, "DAOS", "DAOS_UUID") # nosec
+        assert dst_path is None # nosec
+        self._set_cont_clone_params(src_pool, src_cont, dst_pool, dst_cont)
+
     def _set_cont_clone_params(self,
                                src_pool=None, src_cont=None,
                                dst_pool=None, dst_cont=None):
@@ -816,6 +1072,24 @@ class DataMoverTestBase(IorTestBase, MdtestBase):
             self.cont_clone_cmd.set_cont_clone_params(
                 dst=format_daos_path(dst_pool, dst_cont))
 
+    def _set_dserial_datamover_params(self,
+                                      src_type=None, src_path=None,
+                                      src_pool=None, src_cont=None,
+                                      dst_type=None, dst_path=None,
+                                      dst_pool=None, dst_cont=None):
+        """Set the dserial params from the datamover params.
+
+        Args:
+            see set_datamover_params
+
+        """
+        assert src_type in (None, "DAOS", "DAOS_UUID") #nosec
+        assert src_path is None #nosec
+        assert dst_type in (None, "DAOS", "DAOS_UUID") #nosec
+        assert dst_path is None #nosec
+        assert dst_cont is None #nosec
+        self._set_dserial_params(src_pool, src_cont, dst_pool)
+
     def _set_dserial_params(self,
                             src_pool=None, src_cont=None,
                             dst_pool=None):
@@ -871,11 +1145,8 @@ class DataMoverTestBase(IorTestBase, MdtestBase):
         param_type = self._validate_param_type(param_type)
 
         # Reset params
-        self.ior_cmd.api.update(None)
-        self.ior_cmd.test_file.update(None)
-        self.ior_cmd.dfs_pool.update(None)
-        self.ior_cmd.dfs_cont.update(None)
-        self.ior_cmd.dfs_group.update(None)
+        self.ior_cmd.bulk_reset(
+            ("api", "test_file", "dfs_pool", "dfs_cont", "dfs_group"))
 
         if flags:
             self.ior_cmd.flags.update(flags, "flags" if display else None)
@@ -883,9 +1154,6 @@ class DataMoverTestBase(IorTestBase, MdtestBase):
         display_api = "api" if display else None
         display_test_file = "test_file" if display else None
 
-        # Allow cont to be either the container or the uuid
-        cont_uuid = uuid_from_obj(cont)
-
         # Optionally append suffix
         if path_suffix:
             if path_suffix[0] == "/":
@@ -896,6 +1164,8 @@ class DataMoverTestBase(IorTestBase, MdtestBase):
             self.ior_cmd.api.update("POSIX", display_api)
             self.ior_cmd.test_file.update(path, display_test_file)
         elif param_type in ("DAOS_UUID", "DAOS_UNS"):
+            # Allow cont to be either the container or the uuid
+            cont_uuid = uuid_from_obj(cont)
             self.ior_cmd.api.update("DFS", display_api)
             self.ior_cmd.test_file.update(path, display_test_file)
             if pool and cont_uuid:
@@ -922,11 +1192,9 @@ class DataMoverTestBase(IorTestBase, MdtestBase):
                 Defaults to False.
 
         """
-        self.set_ior_params(param_type, path, pool, cont,
-                            path_suffix, flags, display)
-        self.run_ior(self.get_ior_job_manager_command(), self.ior_processes,
-                     display_space=(display_space and bool(pool)),
-                     pool=pool)
+        self._run_workload(
+            "ior", param_type, path, pool, cont, path_suffix, flags, display,
+            display_space=display_space)
 
     def set_mdtest_params(self, param_type, path, pool=None, cont=None,
                           flags=None, display=True):
@@ -944,11 +1212,8 @@ class DataMoverTestBase(IorTestBase, MdtestBase):
         param_type = self._validate_param_type(param_type)
 
         # Reset params
-        self.mdtest_cmd.api.update(None)
-        self.mdtest_cmd.test_dir.update(None)
-        self.mdtest_cmd.dfs_pool_uuid.update(None)
-        self.mdtest_cmd.dfs_cont.update(None)
-        self.mdtest_cmd.dfs_group.update(None)
+        self.mdtest_cmd.bulk_reset(
+            ("api", "test_dir", "dfs_pool_uuid", "dfs_cont", "dfs_group"))
 
         if flags:
             self.mdtest_cmd.flags.update(flags, "flags" if display else None)
@@ -956,13 +1221,12 @@ class DataMoverTestBase(IorTestBase, MdtestBase):
         display_api = "api" if display else None
         display_test_dir = "test_dir" if display else None
 
-        # Allow cont to be either the container or the uuid
-        cont_uuid = uuid_from_obj(cont)
-
         if param_type == "POSIX":
             self.mdtest_cmd.api.update("POSIX", display_api)
             self.mdtest_cmd.test_dir.update(path, display_test_dir)
         elif param_type in ("DAOS_UUID", "DAOS_UNS"):
+            # Allow cont to be either the container or the uuid
+            cont_uuid = uuid_from_obj(cont)
             self.mdtest_cmd.api.update("DFS", display_api)
             self.mdtest_cmd.test_dir.update(path, display_test_dir)
             if pool and cont_uuid:
@@ -985,28 +1249,225 @@ class DataMoverTestBase(IorTestBase, MdtestBase):
             display (bool, optional): print updated params. Defaults to True.
 
         """
-        self.set_mdtest_params(param_type, path, pool, cont, flags, display)
-        self.run_mdtest(self.get_mdtest_job_manager_command(self.manager),
-                        self.mdtest_processes,
-                        display_space=(bool(pool)), pool=pool)
+        self._run_workload(
+            "mdtest", param_type, path, pool, cont, flags, display,
+            display_space=True)
+
+    def _run_workload(self, kind, param_type, path, pool, *args,
+                      display_space=False):
+        """Set the params for and run an ior or mdtest workload.
+
+        Args:
+            kind (str): the workload to run, either "ior" or "mdtest"
+            param_type (str): how to interpret the params.
+            path (str): cont path or posix path.
+            pool (TestPool): the pool object or None
+            args: the remaining arguments for the workload's param setter
+            display_space (bool, optional): whether to display the pool space.
+                Defaults to False.
+
+        """
+        set_params, run, get_manager, processes = self._workloads[kind]
+        set_params(param_type, path, pool, *args)
+        run(get_manager(), getattr(self, processes),
+            display_space=(display_space and bool(pool)), pool=pool)
 
-    def run_diff(self, src, dst, deref=False):
+    def run_diff(self, src, dst, deref=False, prefer_local=True):
         """Run linux diff command.
 
+        When this host is the only client and both paths are local
+        directories, the trees are compared in-process instead.
+
         Args:
             src (str): the source path
             dst (str): the destination path
             deref (bool, optional): Whether to dereference symlinks.
                 Defaults to False.
+            prefer_local (bool, optional): Whether to compare local
+                directories without running diff. Defaults to True.
 
         """
-        deref_str = ""
+        if (prefer_local and self._clients_are_local()
+                and os.path.isdir(src) and os.path.isdir(dst)):
+            differences = self._diff_dirs(src, dst, deref)
+            if differences is not None:
+                if differences:
+                    self.fail("diff -r {} {}: {}".format(
+                        src, dst, ", ".join(differences)))
+                return
+
+        args = ["diff", "-r"]
         if not deref:
-            deref_str = "--no-dereference"
+            args.append("--no-dereference")
+        args.extend([src, dst])
+        self.execute_cmd(" ".join(shlex.quote(arg) for arg in args))
 
-        cmd = "diff -r {} '{}' '{}'".format(
-            deref_str, src, dst)
-        self.execute_cmd(cmd)
+    @staticmethod
+    def _diff_dirs(src, dst, deref):
+        """Recursively compare two local directories.
+
+        Args:
+            src (str): the source directory
+            dst (str): the destination directory
+            deref (bool): whether to dereference symlinks
+
+        Returns:
+            list: the paths that differ between the two directories, or None
+                if symlinks are found that must be compared without
+                dereferencing them
+
+        """
+        differences = []
+        pending = [filecmp.dircmp(src, dst, ignore=[])]
+        while pending:
+            dcmp = pending.pop()
+            if not deref:
+                for name in dcmp.common:
+                    if (os.path.islink(join(dcmp.left, name))
+                            or os.path.islink(join(dcmp.right, name))):
+                        return None
+            _, mismatch, errors = filecmp.cmpfiles(
+                dcmp.left, dcmp.right, dcmp.common_files, shallow=False)
+            differences.extend(
+                join(dcmp.left, name) for name in dcmp.left_only)
+            differences.extend(
+                join(dcmp.right, name) for name in dcmp.right_only)
+            differences.extend(
+                join(dcmp.left, name)
+                for name in mismatch + errors + dcmp.common_funny)
+            pending.extend(dcmp.subdirs.values())
+        return differences
+
+    def _run_dcp(self, processes, expected_rc):
+        """Run dcp.
+
+        Args:
+            processes (int): number of mpi processes.
+                defaults to self.dcp_processes
+            expected_rc (int): rc expected to be returned
+
+        Returns:
+            The result "run" object
+
+        """
+        if not processes:
+            processes = self.dcp_processes
+        # If we expect an rc other than 0, don't fail
+        self.dcp_cmd.exit_status_exception = (expected_rc == 0)
+        return self.dcp_cmd.run(processes)
+
+    def _run_dsync(self, processes, expected_rc):
+        """Run dsync.
+
+        Args:
+            processes (int): number of mpi processes.
+                defaults to self.dsync_processes
+            expected_rc (int): rc expected to be returned
+
+        Returns:
+            The result "run" object
+
+        """
+        if not processes:
+            processes = self.dsync_processes
+        # If we expect an rc other than 0, don't fail
+        self.dsync_cmd.exit_status_exception = (expected_rc == 0)
+        return self.dsync_cmd.run(processes)
+
+    def _run_dserial(self, processes, expected_rc):
+        """Run daos-serialize followed by daos-deserialize.
+
+        daos-deserialize reads every HDF5 file written by daos-serialize when
+        it starts, so it is only run once daos-serialize has succeeded.
+
+        Args:
+            processes (int): number of mpi processes for both commands.
+                defaults to self.dserialize_processes and
+                self.ddeserialize_processes
+            expected_rc (int): rc expected to be returned
+
+        Returns:
+            The result "run" object of daos-deserialize, or of daos-serialize
+            if it failed
+
+        """
+        if processes:
+            processes1 = processes2 = processes
+        else:
+            processes1 = self.dserialize_processes
+            processes2 = self.ddeserialize_processes
+        # If we expect an rc other than 0, don't fail
+        self.dserialize_cmd.exit_status_exception = (expected_rc == 0)
+        self.ddeserialize_cmd.exit_status_exception = (expected_rc == 0)
+        result = self.dserialize_cmd.run(processes1)
+        if result.exit_status != 0:
+            return result
+        return self.ddeserialize_cmd.run(processes2)
+
+    def _run_fs_copy(self, processes, expected_rc):
+        # pylint: disable=unused-argument
+        """Run daos filesystem copy.
+
+        Args:
+            processes (int): unused
+            expected_rc (int): rc expected to be returned
+
+        Returns:
+            The result "run" object
+
+        """
+        return self.fs_copy_cmd.run()
+
+    def _run_cont_clone(self, processes, expected_rc):
+        # pylint: disable=unused-argument
+        """Run daos container clone.
+
+        Args:
+            processes (int): unused
+            expected_rc (int): rc expected to be returned
+
+        Returns:
+            The result "run" object
+
+        """
+        return self.cont_clone_cmd.run()
+
+    @staticmethod
+    def _as_list(value):
+        """Convert a singular value to a list.
+
+        Args:
+            value (object): a list, a singular value, or None
+
+        Returns:
+            list: the value if it is a list; otherwise a list containing the
+                value, or an empty list if the value is not set
+
+        """
+        if isinstance(value, list):
+            return value
+        return [value] if value else []
+
+    @staticmethod
+    def _missing_substrings(text, substrings):
+        """Get the substrings that are not found in the text.
+
+        The text is scanned once for all of the substrings. Substrings that
+        overlap a previous match are checked individually.
+
+        Args:
+            text (str): the text to search
+            substrings (list): the substrings expected in the text
+
+        Returns:
+            list: the substrings not found in the text, in the original order
+
+        """
+        if not substrings:
+            return []
+        pattern = re.compile("|".join(map(re.escape, substrings)))
+        found = set(match.group(0) for match in pattern.finditer(text))
+        return [s for s in substrings if s not in found and s not in text]
 
     # pylint: disable=too-many-arguments
     def run_datamover(self, test_desc=None,
@@ -1039,59 +1500,24 @@ class DataMoverTestBase(IorTestBase, MdtestBase):
 
         """
         self.num_run_datamover += 1
-        self.log.info("run_datamover called %s times",
-                      str(self.num_run_datamover))
+        self.log.info("run_datamover called %s times", self.num_run_datamover)
 
         # Set the params if and only if any were passed in
-        have_src_params = (src_type or src_path or src_pool or src_cont)
-        have_dst_params = (dst_type or dst_path or dst_pool or dst_cont)
-        if have_src_params or have_dst_params:
+        if any((src_type, src_path, src_pool, src_cont,
+                dst_type, dst_path, dst_pool, dst_cont)):
             self.set_datamover_params(
                 src_type, src_path, src_pool, src_cont,
                 dst_type, dst_path, dst_pool, dst_cont)
 
-        # Default expected_output and expected_err to empty lists
-        if not expected_output:
-            expected_output = []
-        if not expected_err:
-            expected_err = []
-
-        # Convert singular value to list
-        if not isinstance(expected_output, list):
-            expected_output = [expected_output]
-        if not isinstance(expected_err, list):
-            expected_err = [expected_err]
-
         if test_desc is not None:
             self.log.info("Running %s: %s", self.tool, test_desc)
 
+        runner = self._tool_dispatch.get(self.tool)
+        if runner is None:
+            self.fail("Invalid tool: {}".format(str(self.tool)))
+
         try:
-            if self.tool == "DCP":
-                if not processes:
-                    processes = self.dcp_processes
-                # If we expect an rc other than 0, don't fail
-                self.dcp_cmd.exit_status_exception = (expected_rc == 0)
-                result = self.dcp_cmd.run(processes)
-            elif self.tool == "DSYNC":
-                if not processes:
-                    processes = self.dsync_processes
-                # If we expect an rc other than 0, don't fail
-                self.dsync_cmd.exit_status_exception = (expected_rc == 0)
-                result = self.dsync_cmd.run(processes)
-            elif self.tool== "DSERIAL":
-                if processes:
-                    processes1 = processes2 = processes
-                else:
-                    processes1 = self.dserialize_processes
-                    processes2 = self.ddeserialize_processes
-                result = self.dserialize_cmd.run(processes1)
-                result = self.ddeserialize_cmd.run(processes2)
-            elif self.tool == "FS_COPY":
-                result = self.fs_copy_cmd.run()
-            elif self.tool == "CONT_CLONE":
-                result = self.cont_clone_cmd.run()
-            else:
-                self.fail("Invalid tool: {}".format(str(self.tool)))
+            result = runner(processes, expected_rc)
         except CommandFailure as error:
             self.log.error("%s command failed: %s", str(self.tool), str(error))
             self.fail("Test was expected to pass but it failed: {}\n".format(
@@ -1104,11 +1530,11 @@ class DataMoverTestBase(IorTestBase, MdtestBase):
                 expected_rc, actual_rc, test_desc))
 
         # Check for expected output
-        for s in expected_output:
-            if s not in result.stdout_text:
-                self.fail("stdout expected {}: {}".format(s, test_desc))
-        for s in expected_err:
-            if s not in result.stderr_text:
-                self.fail("stderr expected {}: {}".format(s, test_desc))
+        for s in self._missing_substrings(
+                result.stdout_text, self._as_list(expected_output)):
+            self.fail("stdout expected {}: {}".format(s, test_desc))
+        for s in self._missing_substrings(
+                result.stderr_text, self._as_list(expected_err)):
+            self.fail("stderr expected {}: {}".format(s, test_desc))
 
         return result
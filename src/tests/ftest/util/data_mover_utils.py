@@ -5,6 +5,8 @@
   SPDX-License-Identifier: BSD-2-Clause-Patent
 """
 
+from functools import lru_cache
+
 from command_utils_base import FormattedParameter
 from command_utils_base import BasicParameter
 from command_utils import ExecutableCommand
@@ -35,16 +37,32 @@ def format_daos_path(pool=None, cont=None, path=None):
     Returns:
         str: the formatted path.
 
+    """
+    return _format_daos_path(
+        str(uuid_from_obj(pool)) if pool else None,
+        str(uuid_from_obj(cont)) if cont else None,
+        str(path) if path else None)
+
+@lru_cache(maxsize=256)
+def _format_daos_path(pool_uuid, cont_uuid, path):
+    """Format a daos path from the pool uuid, cont uuid, and path strings.
+
+    Args:
+        pool_uuid (str): the pool uuid or None.
+        cont_uuid (str): the cont uuid or None.
+        path (str): cont path relative to the root or None.
+
+    Returns:
+        str: the formatted path.
+
     """
     daos_path = "daos://"
-    if pool:
-        pool_uuid = uuid_from_obj(pool)
-        daos_path += str(pool_uuid) + "/"
-    if cont:
-        cont_uuid = uuid_from_obj(cont)
-        daos_path += str(cont_uuid) + "/"
-    if path:
-        daos_path += str(path).lstrip("/")
+    if pool_uuid is not None:
+        daos_path += pool_uuid + "/"
+    if cont_uuid is not None:
+        daos_path += cont_uuid + "/"
+    if path is not None:
+        daos_path += path.lstrip("/")
     return daos_path
 
 class MfuCommandBase(ExecutableCommand):
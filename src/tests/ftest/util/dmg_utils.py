@@ -10,7 +10,12 @@ from getpass import getuser
 from grp import getgrgid
 from pwd import getpwuid
 import re
-import json
+
+try:
+    # Use the C-accelerated orjson parser for the dmg JSON output if available
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 from dmg_utils_base import DmgCommandBase
 from general_utils import get_numeric_list
@@ -90,7 +95,7 @@ class DmgCommand(DmgCommandBase):
         finally:
             self.json.update(prev_json_val)
             self.output_check = prev_output_check
-        return json.loads(self.result.stdout)
+        return json_loads(self.result.stdout)
 
     def network_scan(self, provider=None):
         """Get the result of the dmg network scan command.
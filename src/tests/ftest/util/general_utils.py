@@ -21,6 +21,19 @@ from avocado.utils import process
 from ClusterShell.Task import task_self
 from ClusterShell.NodeSet import NodeSet, NodeSetParseError
 
+# Options used for the ssh connections made by run_task()
+SSH_OPTIONS = "-oForwardAgent=yes"
+
+# Additional ssh options used by run_task(..., reuse_ssh=True).  The ssh
+# connection to each host is kept open for a short time after each command and
+# shared by the following commands to avoid repeating the ssh connection setup.
+SSH_REUSE_OPTIONS = " ".join([
+    SSH_OPTIONS,
+    "-oControlMaster=auto",
+    "-oControlPath=/tmp/daos_ssh_%C",
+    "-oControlPersist=60s",
+])
+
 
 class DaosTestError(Exception):
     """DAOS API exception class."""
@@ -286,21 +299,26 @@ def run_command(command, timeout=60, verbose=True, raise_exception=True,
         raise DaosTestError(msg)
 
 
-def run_task(hosts, command, timeout=None):
+def run_task(hosts, command, timeout=None, reuse_ssh=False):
     """Create a task to run a command on each host in parallel.
 
     Args:
         hosts (list): list of hosts
         command (str): the command to run in parallel
         timeout (int, optional): command timeout in seconds. Defaults to None.
+        reuse_ssh (bool, optional): whether to share the ssh connection to each
+            host with the commands run shortly after this one. Defaults to
+            False.
 
     Returns:
         Task: a ClusterShell.Task.Task object for the executed command
 
     """
     task = task_self()
-    # Enable forwarding of the ssh authentication agent connection
-    task.set_info("ssh_options", "-oForwardAgent=yes")
+    # Enable forwarding of the ssh authentication agent connection and
+    # optionally reuse of the ssh connection to each host
+    task.set_info(
+        "ssh_options", SSH_REUSE_OPTIONS if reuse_ssh else SSH_OPTIONS)
     kwargs = {"command": command, "nodes": NodeSet.fromlist(hosts)}
     if timeout is not None:
         kwargs["timeout"] = timeout
@@ -308,7 +326,8 @@ def run_task(hosts, command, timeout=None):
     return task
 
 
-def run_pcmd(hosts, command, verbose=True, timeout=None, expect_rc=0):
+def run_pcmd(hosts, command, verbose=True, timeout=None, expect_rc=0,
+             reuse_ssh=False):
     """Run a command on each host in parallel and get the results.
 
     Args:
@@ -319,6 +338,9 @@ def run_pcmd(hosts, command, verbose=True, timeout=None, expect_rc=0):
         expect_rc (int, optional): display output if the command return code
             does not match this value. Defaults to 0. A value of None will
             bypass this feature.
+        reuse_ssh (bool, optional): whether to share the ssh connection to each
+            host with the commands run shortly after this one. Defaults to
+            False.
 
     Returns:
         list: a list of dictionaries with each entry containing output, exit
@@ -352,7 +374,7 @@ def run_pcmd(hosts, command, verbose=True, timeout=None, expect_rc=0):
     results = []
 
     # Run the command on each host in parallel
-    task = run_task(hosts, command, timeout)
+    task = run_task(hosts, command, timeout, reuse_ssh)
 
     # Get the exit status of each host
     host_exit_status = {
@@ -461,7 +483,8 @@ def get_host_data(hosts, command, text, error, timeout=None):
     return host_data
 
 
-def pcmd(hosts, command, verbose=True, timeout=None, expect_rc=0):
+def pcmd(hosts, command, verbose=True, timeout=None, expect_rc=0,
+         reuse_ssh=False):
     """Run a command on each host in parallel and get the return codes.
 
     Args:
@@ -470,6 +493,9 @@ def pcmd(hosts, command, verbose=True, timeout=None, expect_rc=0):
         verbose (bool, optional): display command output. Defaults to True.
         timeout (int, optional): command timeout in seconds. Defaults to None.
         expect_rc (int, optional): expected return code. Defaults to 0.
+        reuse_ssh (bool, optional): whether to share the ssh connection to each
+            host with the commands run shortly after this one. Defaults to
+            False.
 
     Returns:
         dict: a dictionary of return codes keys and accompanying NodeSet
@@ -477,7 +503,7 @@ def pcmd(hosts, command, verbose=True, timeout=None, expect_rc=0):
 
     """
     # Run the command on each host in parallel
-    results = run_pcmd(hosts, command, verbose, timeout, expect_rc)
+    results = run_pcmd(hosts, command, verbose, timeout, expect_rc, reuse_ssh)
     exit_status = {}
     for result in results:
         if result["exit_status"] not in exit_status:
@@ -1063,10 +1089,16 @@ def distribute_files(hosts, source, destination, mkdir=True, timeout=60,
             hosts, os.path.dirname(destination), verbose=verbose,
             raise_exception=raise_exception)
     if result is None or result.exit_status == 0:
-        if sudo:
+        localhost = gethostname().split(".")[0]
+        if {host.split(".")[0] for host in hosts} == {localhost}:
+            # When this host is the only destination copy the source locally
+            # instead of through clush and ssh
+            command = "{}cp {} {}".format(
+                "sudo -n " if sudo else "", source, destination)
+            result = run_command(command, timeout, verbose, raise_exception)
+        elif sudo:
             # In order to copy a protected file to a remote host in CI the
             # source will first be copied as is to the remote host
-            localhost = gethostname().split(".")[0]
             other_hosts = [host for host in hosts if host != localhost]
             if other_hosts:
                 # Existing files with strict file permissions can cause the
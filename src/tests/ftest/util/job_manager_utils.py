@@ -909,7 +909,8 @@ class Systemctl(JobManager):
         """Check the command logs on each host for a specified string.
 
         Args:
-            pattern (str): regular expression to search for in the logs
+            pattern (str/re.Pattern): regular expression to search for in the
+                logs
             since (str): search log entries from this date.
             until (str, optional): search log entries up to this date. Defaults
                 to None, in which case it is not utilized.
@@ -923,9 +924,11 @@ class Systemctl(JobManager):
                 host
 
         """
+        # Display the regular expression of precompiled patterns
+        pattern_str = getattr(pattern, "pattern", pattern)
         self.log.info(
             "Searching for '%s' in '%s' output on %s",
-            pattern, self._systemctl, self._hosts)
+            pattern_str, self._systemctl, self._hosts)
 
         log_data = None
         detected = 0
@@ -953,7 +956,7 @@ class Systemctl(JobManager):
 
         # Summarize results
         msg = "{}/{} '{}' messages detected in".format(
-            detected, quantity, pattern)
+            detected, quantity, pattern_str)
         runtime = "{}/{} seconds".format(time.time() - start, timeout)
 
         if not complete:
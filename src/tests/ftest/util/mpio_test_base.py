@@ -85,21 +85,9 @@ class MpiioTests(TestWithServers):
 
         try:
             # running tests
-            result = self.mpio.run_mpiio_tests(
+            self.mpio.run_mpiio_tests(
                 self.hostfile_clients, self.pool.uuid, test_repo, test_name,
-                client_processes, self.cont_uuid)
+                client_processes, self.cont_uuid,
+                r"(non-zero exit code|MPI_Abort|MPI_ABORT|ERROR)")
         except MpioFailed as excep:
             self.fail("<{0} Test Failed> \n{1}".format(test_name, excep))
-
-        # Check output for errors
-        for output in (result.stdout_text, result.stderr_text):
-            match = re.findall(
-                r"(non-zero exit code|MPI_Abort|MPI_ABORT|ERROR)", output)
-            if match:
-                self.log.info(
-                    "The following error messages have been detected in the %s "
-                    "output:", test_name)
-                for item in match:
-                    self.log.info("  %s", item)
-                self.fail(
-                    "Error messages detected in {} output".format(test_name))
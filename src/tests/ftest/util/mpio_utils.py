@@ -7,9 +7,18 @@
 
 
 import os
+import re
+import threading
 from env_modules import load_mpi
 from command_utils_base import EnvironmentVariables
-from general_utils import run_command, DaosTestError
+from general_utils import run_command, run_task, DaosTestError
+
+
+# The mpich install prefix detected on each host.  The result of the remote
+# probe does not change during a test run, so it is shared by all MpioUtils
+# objects.
+_MPICH_PREFIXES = {}
+_MPICH_LOCK = threading.Lock()
 
 
 class MpioFailed(Exception):
@@ -19,18 +28,59 @@ class MpioFailed(Exception):
 class MpioUtils():
     """MpioUtils Class."""
 
+    # The executables run for each test name, relative to the test repo
+    EXECUTABLES = {
+        "romio": ("runtests",),
+        "llnl": ("testmpio_daos",),
+        "mpi4py": ("test_io_daos.py",),
+        "hdf5": ("testphdf5", "t_shapesame"),
+    }
+
+    # The command used to run each executable for each test name
+    COMMAND_TEMPLATES = {
+        "romio": "{exe} -fname=daos:test1 -subset",
+        "llnl": "{mpirun} -np {processes} --hostfile {hostfile} {exe} 1",
+        "mpi4py":
+            "{mpirun} -np {processes} --hostfile {hostfile} python {exe}",
+        "hdf5": "{mpirun} -np {processes} --hostfile {hostfile} {exe}",
+    }
+
+    # Additional environment variables required by each test name
+    TEST_ENV = {
+        "llnl": {"MPIO_USER_PATH": "daos:"},
+        "hdf5": {"HDF5_PARAPREFIX": "daos:"},
+    }
+
     def __init__(self):
         """Initialize a MpioUtils object."""
         self.mpichinstall = None
+        self._mpirun = None
+        self._base_env = None
+
+    @property
+    def mpirun(self):
+        """Get the path to the mpich mpirun command.
+
+        Returns:
+            str: the mpirun path for the detected mpich install
+
+        """
+        if self._mpirun is None:
+            self._mpirun = os.path.join(self.mpichinstall, "bin", "mpirun")
+        return self._mpirun
 
     def mpich_installed(self, hostlist):
         """Check if mpich is installed.
 
+        The mpich install prefix of each host is cached for the life of the
+        process so that subsequent calls, from any MpioUtils object, do not
+        repeat the remote probe for the same hosts.
+
         Args:
             hostlist (list): list of hosts
 
         Returns:
-            bool: whether mpich is installed on the first host in the list
+            bool: whether mpich is installed on every host in the list
 
         """
         if not load_mpi('mpich'):
@@ -49,21 +99,38 @@ class MpioUtils():
                   "fi; "                                           \
               "done; "                                             \
               "command -v mpichversion"
-        cmd = '/usr/bin/ssh {} {}'.format(hostlist[0], cmd)
-        try:
-            result = run_command(cmd)
-            self.mpichinstall = \
-                result.stdout_text.rstrip()[:-len('bin/mpichversion')]
-            return True
-
-        except DaosTestError as excep:
-            print("Mpich not installed \n {}".format(excep))
+        with _MPICH_LOCK:
+            hosts = [host for host in hostlist if host not in _MPICH_PREFIXES]
+            if hosts:
+                # Probe all of the uncached hosts in parallel
+                task = run_task(hosts, cmd)
+                failed = [
+                    host for exit_status, host_list in task.iter_retcodes()
+                    if exit_status != 0 for host in host_list]
+                if failed:
+                    print(
+                        "Mpich not installed on {}".format(", ".join(failed)))
+                    return False
+                for output, host_list in task.iter_buffers():
+                    lines = [
+                        line.decode("utf-8").rstrip() for line in output
+                        if line.strip()]
+                    prefix = \
+                        lines[-1][:-len('bin/mpichversion')] if lines else ""
+                    for host in host_list:
+                        _MPICH_PREFIXES[host] = prefix
+
+        self.mpichinstall = _MPICH_PREFIXES.get(hostlist[0])
+        self._mpirun = None
+        if not self.mpichinstall:
+            print("Mpich not installed on {}".format(hostlist[0]))
             return False
-        return False
+        return True
 
     # pylint: disable=R0913
     def run_mpiio_tests(self, hostfile, pool_uuid, test_repo,
-                        test_name, client_processes, cont_uuid):
+                        test_name, client_processes, cont_uuid,
+                        error_pattern=None):
         """Run the LLNL, MPI4PY, and HDF5 testsuites.
 
         Args:
@@ -73,9 +140,13 @@ class MpioUtils():
             test_name (str): name of test to be tested
             client_processes (int): number of client processes
             cont_uuid (str): container UUID
+            error_pattern (str, optional): regular expression matching error
+                messages to detect in the output of each command as soon as
+                it completes. Defaults to None.
 
         Raises:
-            MpioFailed: for an invalid test name or test execution failure
+            MpioFailed: for an invalid test name, test execution failure, or
+                error messages detected in the command output
 
         Return:
             CmdResult: an avocado.utils.process CmdResult object containing the
@@ -85,57 +156,37 @@ class MpioUtils():
         print("self.mpichinstall: {}".format(self.mpichinstall))
 
         # environment variables only to be set on client node
-        env = EnvironmentVariables()
+        if self._base_env is None:
+            self._base_env = EnvironmentVariables()
+            self._base_env["DAOS_BYPASS_DUNS"] = "1"
+        env = self._base_env.copy()
         env["DAOS_POOL"] = "{}".format(pool_uuid)
         env["DAOS_CONT"] = "{}".format(cont_uuid)
-        env["DAOS_BYPASS_DUNS"] = "1"
-        mpirun = os.path.join(self.mpichinstall, "bin", "mpirun")
-
-        executables = {
-            "romio": [os.path.join(test_repo, "runtests")],
-            "llnl": [os.path.join(test_repo, "testmpio_daos")],
-            "mpi4py": [os.path.join(test_repo, "test_io_daos.py")],
-            "hdf5": [
-                os.path.join(test_repo, "testphdf5"),
-                os.path.join(test_repo, "t_shapesame")
-            ]
-        }
 
         # Verify the test name is valid
-        if test_name not in executables:
+        if test_name not in self.EXECUTABLES:
             raise MpioFailed(
                 "Invalid test name: {} not supported".format(test_name))
+        executables = [
+            os.path.join(test_repo, exe) for exe in self.EXECUTABLES[test_name]]
 
         # Verify the executables exist for the valid test name
-        if not all([os.path.join(exe) for exe in executables[test_name]]):
+        missing = [exe for exe in executables if not os.path.isfile(exe)]
+        if missing:
             raise MpioFailed(
                 "Missing test name: {} missing executables {}".format(
-                    test_name, ", ".join(executables[test_name])))
+                    test_name, ", ".join(missing)))
 
         # Setup the commands to run for this test name
-        commands = []
-        if test_name == "romio":
-            commands.append(
-                "{} -fname=daos:test1 -subset".format(
-                    executables[test_name][0]))
-        elif test_name == "llnl":
-            env["MPIO_USER_PATH"] = "daos:"
-            for exe in executables[test_name]:
-                commands.append(
-                    "{} -np {} --hostfile {} {} 1".format(
-                        mpirun, client_processes, hostfile, exe))
-        elif test_name == "mpi4py":
-            for exe in executables[test_name]:
-                commands.append(
-                    "{} -np {} --hostfile {} python {}".format(
-                        mpirun, client_processes, hostfile, exe))
-        elif test_name == "hdf5":
-            env["HDF5_PARAPREFIX"] = "daos:"
-            for exe in executables[test_name]:
-                commands.append(
-                    "{} -np {} --hostfile {} {}".format(
-                        mpirun, client_processes, hostfile, exe))
-
+        env.update(self.TEST_ENV.get(test_name, {}))
+        template = self.COMMAND_TEMPLATES[test_name]
+        commands = [
+            template.format(
+                mpirun=self.mpirun, processes=client_processes,
+                hostfile=hostfile, exe=exe)
+            for exe in executables]
+
+        pattern = re.compile(error_pattern) if error_pattern else None
         for command in commands:
             print("run command: {}".format(command))
             try:
@@ -147,4 +198,14 @@ class MpioUtils():
                     "<Test FAILED> \nException occurred: {}".format(
                         str(excep))) from excep
 
+            # Check the output of this command before running the next one
+            if pattern:
+                matches = [
+                    match for output in (result.stdout_text, result.stderr_text)
+                    for match in pattern.findall(output)]
+                if matches:
+                    raise MpioFailed(
+                        "Error messages detected in {} output: {}".format(
+                            test_name, ", ".join(matches)))
+
         return result
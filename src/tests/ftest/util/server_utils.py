@@ -5,8 +5,13 @@
   SPDX-License-Identifier: BSD-2-Clause-Patent
 """
 # pylint: disable=too-many-lines
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from getpass import getuser
+import hashlib
 import os
+import re
 import socket
 import time
 import yaml
@@ -14,7 +19,8 @@ import yaml
 from avocado import fail_on
 
 from command_utils_base import \
-    CommandFailure, FormattedParameter, CommandWithParameters, CommonConfig
+    CommandFailure, FormattedParameter, CommandWithParameters, CommonConfig, \
+    YAML_SAFE_DUMPER
 from command_utils import YamlCommand, CommandWithSubCommand, SubprocessManager
 from general_utils import pcmd, get_log_file, human_to_bytes, bytes_to_human, \
     convert_list, get_default_config_file, distribute_files, DaosTestError
@@ -22,6 +28,20 @@ from dmg_utils import get_dmg_command
 from server_utils_params import \
     DaosServerTransportCredentials, DaosServerYamlParameters
 
+# The short name of this host and the user running the tests
+_LOCAL_HOST = socket.gethostname().split('.', 1)[0]
+_CURRENT_USER = getuser()
+
+# The dmg storage scan keys of the devices of each capacity type: the device
+# list, the device name and the optional list of device namespaces with sizes
+_CAPACITY_KEYS = {
+    "nvme": ("nvme_devices", "pci_addr", "namespaces"),
+    "scm": ("scm_namespaces", "blockdev", None),
+}
+
+# The host name at the start of a dmg system query rank fault domain
+_FAULT_DOMAIN_RE = re.compile(r"^/?([^./]+)")
+
 
 def get_server_command(group, cert_dir, bin_dir, config_file, config_temp=None):
     """Get the daos_server command object to manage.
@@ -52,6 +72,38 @@ def get_server_command(group, cert_dir, bin_dir, config_file, config_temp=None):
     return command
 
 
+def get_storage_prepare_command(bin_dir, target_user=None, hugepages=None,
+                                nvme_only=False, scm_only=False, reset=False):
+    """Get the 'daos_server storage prepare --force' command string.
+
+    The string matches the one produced by a DaosServerCommand object set with
+    the same 'storage prepare' options, without building the command object.
+
+    Args:
+        bin_dir (str): location of the daos_server executable
+        target_user (str, optional): user that will own the hugepage mount point
+            directory and vfio groups. Defaults to None.
+        hugepages (int, optional): number of hugepages to allocate. Defaults to
+            None.
+        nvme_only (bool, optional): only prepare NVMe storage. Defaults to
+            False.
+        scm_only (bool, optional): only prepare SCM. Defaults to False.
+        reset (bool, optional): reset the storage. Defaults to False.
+
+    Returns:
+        str: the daos_server storage prepare command
+
+    """
+    return "{} storage prepare --force{}{}{}{}{}".format(
+        os.path.join(bin_dir, "daos_server"),
+        " --hugepages={}".format(hugepages) if hugepages is not None else "",
+        " --nvme-only" if nvme_only else "",
+        " --reset" if reset else "",
+        " --scm-only" if scm_only else "",
+        " --target-user={}".format(target_user)
+        if target_user is not None else "")
+
+
 class ServerFailed(Exception):
     """Server didn't start/stop properly."""
 
@@ -59,9 +111,9 @@ class ServerFailed(Exception):
 class DaosServerCommand(YamlCommand):
     """Defines an object representing the daos_server command."""
 
-    NORMAL_PATTERN = "DAOS I/O Engine.*started"
-    FORMAT_PATTERN = "(SCM format required)(?!;)"
-    REFORMAT_PATTERN = "Metadata format required"
+    NORMAL_PATTERN = re.compile("DAOS I/O Engine.*started")
+    FORMAT_PATTERN = re.compile("(SCM format required)(?!;)")
+    REFORMAT_PATTERN = re.compile("Metadata format required")
 
     DEFAULT_CONFIG_FILE = os.path.join(os.sep, "etc", "daos", "daos_server.yml")
 
@@ -79,6 +131,12 @@ class DaosServerCommand(YamlCommand):
             "/run/daos_server/*", "daos_server", path, yaml_cfg, timeout)
         self.pattern = self.NORMAL_PATTERN
 
+        # The optional YamlParameters attributes used by this class.  Checking
+        # the class avoids evaluating the using_* properties with hasattr().
+        self._yaml_attrs = frozenset(
+            name for name in ("using_nvme", "using_dcpm", "get_engine_values")
+            if hasattr(type(self.yaml), name))
+
         # If specified use the configuration file from the YamlParameters object
         default_yaml_file = None
         if self.yaml is not None and hasattr(self.yaml, "filename"):
@@ -99,6 +157,9 @@ class DaosServerCommand(YamlCommand):
         # Used to override the sub_command.value parameter value
         self.sub_command_override = None
 
+        # Per-engine values, as parallel lists, used when managing the servers
+        self._engine_view = None
+
         # Include the daos_engine command launched by the daos_server
         # command.
         self._exe_names.append("daos_engine")
@@ -113,18 +174,9 @@ class DaosServerCommand(YamlCommand):
             # Use the sub_command parameter from the test's yaml
             sub_command = self.sub_command.value
 
-        # Available daos_server sub-commands:
-        #   network  Perform network device scan based on fabric provider
-        #   start    Start daos_server
-        #   storage  Perform tasks related to locally-attached storage
-        if sub_command == "network":
-            self.sub_command_class = self.StartSubCommand()
-        elif sub_command == "start":
-            self.sub_command_class = self.StartSubCommand()
-        elif sub_command == "storage":
-            self.sub_command_class = self.StorageSubCommand()
-        else:
-            self.sub_command_class = None
+        sub_command_class = self.SUB_COMMAND_CLASSES.get(sub_command)
+        self.sub_command_class = \
+            sub_command_class() if sub_command_class is not None else None
 
     def get_params(self, test):
         """Get values for the daos command and its yaml config file.
@@ -140,6 +192,49 @@ class DaosServerCommand(YamlCommand):
             getattr(test, "helper_log"),
             getattr(test, "server_log")
         )
+        self.update_engine_view()
+
+    @property
+    def engine_view(self):
+        """Get the per-engine values used when managing the servers.
+
+        Returns:
+            dict: the engine "count" and the "scm_mounts" and "scm_lists" lists
+                of each engine's scm_mount and scm_list values
+
+        """
+        if self._engine_view is None:
+            self.update_engine_view()
+        return self._engine_view
+
+    def update_engine_view(self):
+        """Update the per-engine values from the current engine parameters.
+
+        This must be called after any change to the engine parameters.
+        """
+        engine_params = self.yaml.engine_params
+        self._engine_view = {
+            "count": len(engine_params),
+            "scm_mounts": [
+                params.get_value("scm_mount") for params in engine_params],
+            "scm_lists": [
+                params.get_value("scm_list") for params in engine_params],
+        }
+
+    def set_config_value(self, name, value):
+        """Set the yaml configuration parameter value.
+
+        Args:
+            name (str): name of the yaml configuration parameter
+            value (object): value to set
+
+        Returns:
+            bool: if the attribute name was found and the value was set
+
+        """
+        status = super().set_config_value(name, value)
+        self.update_engine_view()
+        return status
 
     def update_pattern(self, mode, host_qty):
         """Update the pattern used to determine if the daos_server started.
@@ -154,7 +249,7 @@ class DaosServerCommand(YamlCommand):
             self.pattern = self.REFORMAT_PATTERN
         else:
             self.pattern = self.NORMAL_PATTERN
-        self.pattern_count = host_qty * len(self.yaml.engine_params)
+        self.pattern_count = host_qty * self.engine_view["count"]
 
     @property
     def using_nvme(self):
@@ -165,7 +260,7 @@ class DaosServerCommand(YamlCommand):
 
         """
         value = False
-        if self.yaml is not None and hasattr(self.yaml, "using_nvme"):
+        if "using_nvme" in self._yaml_attrs:
             value = self.yaml.using_nvme
         return value
 
@@ -178,7 +273,7 @@ class DaosServerCommand(YamlCommand):
 
         """
         value = False
-        if self.yaml is not None and hasattr(self.yaml, "using_dcpm"):
+        if "using_dcpm" in self._yaml_attrs:
             value = self.yaml.using_dcpm
         return value
 
@@ -194,7 +289,7 @@ class DaosServerCommand(YamlCommand):
 
         """
         engine_values = []
-        if self.yaml is not None and hasattr(self.yaml, "get_engine_values"):
+        if "get_engine_values" in self._yaml_attrs:
             engine_values = self.yaml.get_engine_values(name)
         return engine_values
 
@@ -316,6 +411,16 @@ class DaosServerCommand(YamlCommand):
                 self.reset = FormattedParameter("--reset", False)
                 self.force = FormattedParameter("--force", False)
 
+    # Available daos_server sub-commands:
+    #   network  Perform network device scan based on fabric provider
+    #   start    Start daos_server
+    #   storage  Perform tasks related to locally-attached storage
+    SUB_COMMAND_CLASSES = {
+        "network": NetworkSubCommand,
+        "start": StartSubCommand,
+        "storage": StorageSubCommand,
+    }
+
 
 class DaosServerManager(SubprocessManager):
     # pylint: disable=too-many-public-methods
@@ -328,9 +433,56 @@ class DaosServerManager(SubprocessManager):
         "OFI_PORT": "fabric_iface_port",
     }
 
+    # Maximum number of ranks stopped by a single 'dmg system stop' command
+    STOP_RANKS_BATCH = 16
+
     # Defined in telemetry_common.h
     D_TM_SHARED_MEMORY_KEY = 0x10242048
 
+    # Script run by clean_files() on each host to remove the superblocks and
+    # dismount the scm mount points (-m), remove the shared memory segments
+    # (-k), and dismount and wipe the dcpm devices (-d)
+    CLEAN_SCRIPT = "\n".join([
+        "#!/bin/bash",
+        "mounts=()",
+        "keys=()",
+        "devices=()",
+        "while getopts 'm:k:d:' opt; do",
+        "    case $opt in",
+        "        m) mounts+=(\"$OPTARG\");;",
+        "        k) keys+=(\"$OPTARG\");;",
+        "        d) devices+=(\"$OPTARG\");;",
+        "        *) exit 1;;",
+        "    esac",
+        "done",
+        "for mnt in \"${mounts[@]}\"; do",
+        "    sudo rm -fr $mnt/*",
+        "    while sudo umount $mnt; do continue; done",
+        "done",
+        "for key in \"${keys[@]}\"; do",
+        "    sudo ipcrm -M $key",
+        "done",
+        "for dev in \"${devices[@]}\"; do",
+        "    mount=$(lsblk $dev -n -o MOUNTPOINT)",
+        "    if [ ! -z $mount ]; then",
+        "        while sudo umount $mount; do continue; done",
+        "    fi",
+        "    sudo wipefs -a $dev",
+        "done",
+        ""])
+
+    # States for verify_expected_states()
+    _STATES = {
+        "all": (
+            "awaitformat", "starting", "ready", "joined", "stopping",
+            "stopped", "excluded", "errored", "unresponsive", "unknown"),
+        "running": ("ready", "joined"),
+        "stopped": (
+            "stopping", "stopped", "excluded", "errored", "unresponsive",
+            "unknown"),
+        "errored": ("errored",),
+    }
+
     def __init__(self, group, bin_dir,
                  svr_cert_dir, svr_config_file, dmg_cert_dir, dmg_config_file,
                  svr_config_temp=None, dmg_config_temp=None, manager="Orterun"):
@@ -366,19 +518,36 @@ class DaosServerManager(SubprocessManager):
         # Set the correct certificate file ownership
         if manager == "Systemctl":
             self.manager.job.certificate_owner = "daos_server"
-            self.dmg.certificate_owner = getuser()
+            self.dmg.certificate_owner = _CURRENT_USER
+
+        # The last rank states obtained from a dmg system query while polling
+        # the system state and when they were obtained.  Polling calls to
+        # get_current_state() within the TTL reuse these states.
+        self._query_cache = None
+        self._state_ttl = 0.25
+
+        # The digest of the last config file copied by
+        # update_config_file_from_file() and the hosts to which it was copied
+        self._pushed_config_digest = None
+        self._pushed_config_hosts = None
+
+        # The storage sizes found by get_available_storage() and the hosts and
+        # storage config used to find them
+        self._storage_cache = None
+
+        # Cached get_config_value() results, cleared whenever the server config
+        # may have been changed
+        self._config_value_cache = {}
+
+        # The storage prepare and reset commands only differ by the options
+        # added to the fixed command for each call
+        self._storage_prepare_cmd = get_storage_prepare_command(
+            self.manager.job.command_path)
+        self._storage_reset_cmd = get_storage_prepare_command(
+            self.manager.job.command_path, nvme_only=True, reset=True)
 
         # Server states
-        self._states = {
-            "all": [
-                "awaitformat", "starting", "ready", "joined", "stopping",
-                "stopped", "excluded", "errored", "unresponsive", "unknown"],
-            "running": ["ready", "joined"],
-            "stopped": [
-                "stopping", "stopped", "excluded", "errored", "unresponsive",
-                "unknown"],
-            "errored": ["errored"],
-        }
+        self._states = self._STATES
 
     def get_params(self, test):
         """Get values for all of the command params from the yaml file.
@@ -390,9 +559,42 @@ class DaosServerManager(SubprocessManager):
             test (Test): avocado Test object
         """
         super().get_params(test)
+        self._config_value_cache.clear()
         # Get the values for the dmg parameters
         self.dmg.get_params(test)
 
+    def set_config_value(self, name, value):
+        """Set the yaml configuration parameter value.
+
+        Args:
+            name (str): name of the yaml configuration parameter
+            value (object): value to set
+
+        Returns:
+            bool: if the attribute name was found and the value was set
+
+        """
+        self._config_value_cache.clear()
+        return super().set_config_value(name, value)
+
+    def get_config_value(self, name):
+        """Get the value of the yaml configuration parameter name.
+
+        The value is cached until the server config is next changed through
+        this object or the servers are next prepared or started.
+
+        Args:
+            name (str): name of the yaml configuration parameter from which to
+                get the value
+
+        Returns:
+            object: the yaml configuration parameter value or None
+
+        """
+        if name not in self._config_value_cache:
+            self._config_value_cache[name] = super().get_config_value(name)
+        return self._config_value_cache[name]
+
     def prepare_dmg(self, hosts=None):
         """Prepare the dmg command prior to its execution.
 
@@ -411,9 +613,8 @@ class DaosServerManager(SubprocessManager):
 
     def _prepare_dmg_certificates(self):
         """Set up dmg certificates."""
-        local_host = socket.gethostname().split('.', 1)[0]
         self.dmg.copy_certificates(
-            get_log_file("daosCA/certs"), local_host.split())
+            get_log_file("daosCA/certs"), _LOCAL_HOST.split())
 
     def _prepare_dmg_hostlist(self, hosts=None):
         """Set up the dmg command host list to use the specified hosts.
@@ -426,6 +627,26 @@ class DaosServerManager(SubprocessManager):
             hosts = self._hosts
         self.dmg.hostlist = hosts
 
+    @contextmanager
+    def _dmg_hostlist(self, hosts):
+        """Temporarily set up the dmg command host list to use the hosts.
+
+        The previous dmg command host list is restored on exit, if it was
+        changed, even if an exception is raised.
+
+        Args:
+            hosts (list): dmg hostlist value to use within the context
+        """
+        previous = self.dmg.hostlist
+        if isinstance(previous, list):
+            previous = list(previous)
+        self._prepare_dmg_hostlist(hosts)
+        try:
+            yield
+        finally:
+            if self.dmg.hostlist != previous:
+                self._prepare_dmg_hostlist(previous or None)
+
     def prepare(self, storage=True):
         """Prepare to start daos_server.
 
@@ -437,14 +658,35 @@ class DaosServerManager(SubprocessManager):
             "<SERVER> Preparing to start daos_server on %s with %s",
             self._hosts, self.manager.command)
 
-        # Create the daos_server yaml file
-        self.manager.job.temporary_file_hosts = self._hosts
-        self.manager.job.create_yaml_file()
+        # Kill any daos servers running on the hosts
+        self.manager.kill()
 
-        # Copy certificates
-        self.manager.job.copy_certificates(
-            get_log_file("daosCA/certs"), self._hosts)
-        self._prepare_dmg_certificates()
+        # Create the daos_server yaml file and copy the server and dmg
+        # certificates.  These steps are independent of each other, so run
+        # them concurrently.
+        self._config_value_cache.clear()
+        self.manager.job.update_engine_view()
+        self.manager.job.temporary_file_hosts = self._hosts
+        if self.manager.job.yaml.filename == get_default_config_file("server"):
+            # The config file copied by update_config_file_from_file() will be
+            # replaced
+            self._pushed_config_digest = None
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(self.manager.job.create_yaml_file),
+                executor.submit(
+                    self.manager.job.copy_certificates,
+                    get_log_file("daosCA/certs"), self._hosts),
+                executor.submit(self._prepare_dmg_certificates),
+            ]
+            wait(futures)
+        errors = [
+            future.exception() for future in futures
+            if future.exception() is not None]
+        for error in errors:
+            self.log.error("Error preparing to start daos_server: %s", error)
+        if errors:
+            raise errors[0]
 
         # Prepare dmg for running storage format on all server hosts
         self._prepare_dmg_hostlist(self._hosts)
@@ -454,9 +696,6 @@ class DaosServerManager(SubprocessManager):
             self.dmg.insecure.update(
                 self.get_config_value("allow_insecure"), "dmg.insecure")
 
-        # Kill any daos servers running on the hosts
-        self.manager.kill()
-
         # Clean up any files that exist on the hosts
         self.clean_files()
 
@@ -470,7 +709,7 @@ class DaosServerManager(SubprocessManager):
                         {"plm_rsh_args": "-l root"}, "orterun.mca", True)
 
         # Verify the socket directory exists when using a non-systemctl manager
-        self.verify_socket_directory(getuser())
+        self.verify_socket_directory(_CURRENT_USER)
 
     def clean_files(self, verbose=True):
         """Clean up the daos server files.
@@ -478,49 +717,32 @@ class DaosServerManager(SubprocessManager):
         Args:
             verbose (bool, optional): display clean commands. Defaults to True.
         """
-        clean_commands = []
-        for index, engine_params in \
-                enumerate(self.manager.job.yaml.engine_params):
-            scm_mount = engine_params.get_value("scm_mount")
+        # Unique scm mount points and dcpm devices, in engine order
+        engine_view = self.manager.job.engine_view
+        scm_mounts = {}
+        scm_devices = {}
+        for scm_mount in engine_view["scm_mounts"]:
             self.log.info("Cleaning up the %s directory.", str(scm_mount))
+            scm_mounts[scm_mount] = None
 
-            # Remove the superblocks
-            cmd = "sudo rm -fr {}/*".format(scm_mount)
-            if cmd not in clean_commands:
-                clean_commands.append(cmd)
-
-            # Remove the shared memory segment associated with this io server
-            cmd = "sudo ipcrm -M {}".format(self.D_TM_SHARED_MEMORY_KEY + index)
-            clean_commands.append(cmd)
-
-            # Dismount the scm mount point
-            cmd = "while sudo umount {}; do continue; done".format(scm_mount)
-            if cmd not in clean_commands:
-                clean_commands.append(cmd)
-
-            if self.manager.job.using_dcpm:
-                scm_list = engine_params.get_value("scm_list")
+        if self.manager.job.using_dcpm:
+            for scm_list in engine_view["scm_lists"]:
                 if isinstance(scm_list, list):
                     self.log.info(
                         "Cleaning up the following device(s): %s.",
                         ", ".join(scm_list))
-                    # Umount and wipefs the dcpm device
-                    cmd_list = [
-                        "for dev in {}".format(" ".join(scm_list)),
-                        "do mount=$(lsblk $dev -n -o MOUNTPOINT)",
-                        "if [ ! -z $mount ]",
-                        "then while sudo umount $mount",
-                        "do continue",
-                        "done",
-                        "fi",
-                        "sudo wipefs -a $dev",
-                        "done"
-                    ]
-                    cmd = "; ".join(cmd_list)
-                    if cmd not in clean_commands:
-                        clean_commands.append(cmd)
-
-        pcmd(self._hosts, "; ".join(clean_commands), verbose)
+                    scm_devices.update(dict.fromkeys(scm_list))
+
+        clean_args = ["-m {}".format(scm_mount) for scm_mount in scm_mounts]
+        # Remove the shared memory segment associated with each io server
+        clean_args.extend(
+            "-k {}".format(self.D_TM_SHARED_MEMORY_KEY + index)
+            for index in range(engine_view["count"]))
+        clean_args.extend("-d {}".format(device) for device in scm_devices)
+
+        command = "bash -s -- {} <<'EOF'\n{}EOF".format(
+            " ".join(clean_args), self.CLEAN_SCRIPT)
+        pcmd(self._hosts, command, verbose, reuse_ssh=True)
 
     def prepare_storage(self, user, using_dcpm=None, using_nvme=None):
         """Prepare the server storage.
@@ -538,31 +760,32 @@ class DaosServerManager(SubprocessManager):
             ServerFailed: if there was an error preparing the storage
 
         """
-        cmd = DaosServerCommand(self.manager.job.command_path)
-        cmd.sudo = False
-        cmd.debug.value = False
-        cmd.set_sub_command("storage")
-        cmd.sub_command_class.set_sub_command("prepare")
-        cmd.sub_command_class.sub_command_class.target_user.value = user
-        cmd.sub_command_class.sub_command_class.force.value = True
-
         # Use the configuration file settings if no overrides specified
         if using_dcpm is None:
             using_dcpm = self.manager.job.using_dcpm
         if using_nvme is None:
             using_nvme = self.manager.job.using_nvme
+        if not using_dcpm and not using_nvme:
+            self.log.info(
+                "Skipping DAOS server storage prepare: no dcpm or nvme storage")
+            return
 
-        if using_dcpm and not using_nvme:
-            cmd.sub_command_class.sub_command_class.scm_only.value = True
-        elif not using_dcpm and using_nvme:
-            cmd.sub_command_class.sub_command_class.nvme_only.value = True
-
+        hugepages = None
         if using_nvme:
             hugepages = self.get_config_value("nr_hugepages")
-            cmd.sub_command_class.sub_command_class.hugepages.value = hugepages
 
-        self.log.info("Preparing DAOS server storage: %s", str(cmd))
-        result = pcmd(self._hosts, str(cmd), timeout=40)
+        options = [self._storage_prepare_cmd]
+        if hugepages is not None:
+            options.append("--hugepages={}".format(hugepages))
+        if using_nvme and not using_dcpm:
+            options.append("--nvme-only")
+        elif using_dcpm and not using_nvme:
+            options.append("--scm-only")
+        options.append("--target-user={}".format(user))
+        cmd = " ".join(options)
+
+        self.log.info("Preparing DAOS server storage: %s", cmd)
+        result = pcmd(self._hosts, cmd, timeout=40, reuse_ssh=True)
         if len(result) > 1 or 0 not in result:
             dev_type = "nvme"
             if using_dcpm and using_nvme:
@@ -582,9 +805,10 @@ class DaosServerManager(SubprocessManager):
             ServerFailed: if there was an error starting the servers.
 
         """
+        self._query_cache = None
         f_type = "format" if not reformat else "reformat"
         self.log.info("<SERVER> Waiting for servers to be ready for %s", f_type)
-        self.manager.job.update_pattern(f_type, len(self._hosts))
+        self.manager.job.update_pattern(f_type, self._host_qty)
         try:
             self.manager.run()
         except CommandFailure as error:
@@ -605,9 +829,9 @@ class DaosServerManager(SubprocessManager):
 
         """
         if host_qty is None:
-            hosts_qty = len(self._hosts)
+            host_qty = self._host_qty
         self.log.info("<SERVER> Waiting for the daos_engine to start")
-        self.manager.job.update_pattern("normal", hosts_qty)
+        self.manager.job.update_pattern("normal", host_qty)
         if not self.manager.check_subprocess_status(self.manager.process):
             self.manager.kill()
             raise ServerFailed("Failed to start servers after format")
@@ -625,17 +849,9 @@ class DaosServerManager(SubprocessManager):
             ServerFailed: if there was an error resetting the storage
 
         """
-        cmd = DaosServerCommand(self.manager.job.command_path)
-        cmd.sudo = False
-        cmd.debug.value = False
-        cmd.set_sub_command("storage")
-        cmd.sub_command_class.set_sub_command("prepare")
-        cmd.sub_command_class.sub_command_class.nvme_only.value = True
-        cmd.sub_command_class.sub_command_class.reset.value = True
-        cmd.sub_command_class.sub_command_class.force.value = True
-
-        self.log.info("Resetting DAOS server storage: %s", str(cmd))
-        result = pcmd(self._hosts, str(cmd), timeout=120)
+        self.log.info(
+            "Resetting DAOS server storage: %s", self._storage_reset_cmd)
+        result = pcmd(self._hosts, self._storage_reset_cmd, timeout=120)
         if len(result) > 1 or 0 not in result:
             raise ServerFailed("Error resetting NVMe storage")
 
@@ -647,22 +863,23 @@ class DaosServerManager(SubprocessManager):
             verbose (bool, optional): display commands. Defaults to False.
 
         """
-        user = getuser() if user is None else user
-
-        cmd_list = set()
-        for engine_params in self.manager.job.yaml.engine_params:
-            scm_mount = engine_params.scm_mount.value
+        user = _CURRENT_USER if user is None else user
 
+        # Unique scm mount points, in engine order
+        all_mounts = {}
+        for scm_mount in self.manager.job.engine_view["scm_mounts"]:
             # Support single or multiple scm_mount points
             if not isinstance(scm_mount, list):
                 scm_mount = [scm_mount]
 
             self.log.info("Changing ownership to %s for: %s", user, scm_mount)
-            cmd_list.add(
-                "sudo chown -R {0}:{0} {1}".format(user, " ".join(scm_mount)))
+            all_mounts.update(dict.fromkeys(scm_mount))
 
-        if cmd_list:
-            pcmd(self._hosts, "; ".join(cmd_list), verbose)
+        if all_mounts:
+            pcmd(
+                self._hosts,
+                "sudo chown -R {0}:{0} {1}".format(user, " ".join(all_mounts)),
+                verbose)
 
     def start(self):
         """Start the server through the job manager."""
@@ -691,6 +908,7 @@ class DaosServerManager(SubprocessManager):
 
         # Maintain a running list of errors detected trying to stop
         messages = []
+        self._query_cache = None
 
         # Stop the subprocess running the job manager command
         try:
@@ -711,7 +929,8 @@ class DaosServerManager(SubprocessManager):
                 messages.append(str(error))
 
             # Make sure the mount directory belongs to non-root user
-            self.set_scm_mount_ownership()
+            if any(self.manager.job.engine_view["scm_mounts"]):
+                self.set_scm_mount_ownership()
 
         # Report any errors after all stop actions have been attempted
         if messages:
@@ -734,13 +953,11 @@ class DaosServerManager(SubprocessManager):
                 environment variable name
 
         """
-        try:
-            setting = self.ENVIRONMENT_VARIABLE_MAPPING[name]
-
-        except IndexError as error:
+        setting = self.ENVIRONMENT_VARIABLE_MAPPING.get(name)
+        if setting is None:
             raise ServerFailed(
                 "Unknown server config setting mapping for the {} environment "
-                "variable!".format(name)) from error
+                "variable!".format(name))
 
         return self.get_config_value(setting)
 
@@ -759,32 +976,53 @@ class DaosServerManager(SubprocessManager):
             # The regex failed to get the rank and state
             raise ServerFailed(
                 "Error obtaining {} output: {}".format(self.dmg, data))
-        try:
-            states = list(set([data[rank]["state"] for rank in data]))
-        except KeyError as error:
-            raise ServerFailed(
-                "Unexpected result from {} - missing 'state' key: {}".format(
-                    self.dmg, data)) from error
-        if len(states) > 1:
-            # Multiple states for different ranks detected
-            raise ServerFailed(
-                "Multiple system states ({}) detected:\n  {}".format(
-                    states, data))
-        return states[0]
+        return self._get_homogeneous_state(data)
+
+    def _get_homogeneous_state(self, data):
+        """Get the single state shared by all of the ranks.
+
+        Args:
+            data (dict): rank states from get_current_state()
+
+        Raises:
+            ServerFailed: if a single state for all servers is not detected
+
+        Returns:
+            str: the DAOS system state
+
+        """
+        state = None
+        for info in data.values():
+            if "state" not in info:
+                raise ServerFailed(
+                    "Unexpected result from {} - missing 'state' key: {}".format(
+                        self.dmg, data))
+            if state is None:
+                state = info["state"]
+            elif info["state"] != state:
+                # Multiple states for different ranks detected
+                raise ServerFailed(
+                    "Multiple system states ({}) detected:\n  {}".format(
+                        [state, info["state"]], data))
+        return state
 
-    def check_system_state(self, valid_states, max_checks=1):
+    def check_system_state(self, valid_states, timeout=0):
         """Check that the DAOS system state is one of the provided states.
 
         Fail the test if the current state does not match one of the specified
-        valid states.  Optionally the state check can loop multiple times,
-        sleeping one second between checks, by increasing the number of maximum
-        checks.
+        valid states.  Optionally the state check can be repeated until the
+        timeout expires by specifying a timeout.  The delay between checks
+        starts at 0.05 seconds and doubles after each check, up to one second.
+
+        While checking, ranks may be in different states.  Ranks that have
+        reached a valid state are not queried again.  Once every rank is in a
+        valid state, all the ranks must share a single state.
 
         Args:
             valid_states (list): expected DAOS system states as a list of
                 lowercase strings
-            max_checks (int, optional): number of times to check the state.
-                Defaults to 1.
+            timeout (float, optional): number of seconds to keep checking the
+                state. Defaults to 0 - check the state once.
 
         Raises:
             ServerFailed: if there was an error detecting the server state or
@@ -794,22 +1032,44 @@ class DaosServerManager(SubprocessManager):
             str: the matching valid detected state
 
         """
+        deadline = time.monotonic() + timeout
+        states = frozenset(valid_states)
+        data = {}
+        pending = None
         checks = 0
-        daos_state = "????"
-        while daos_state not in valid_states and checks < max_checks:
+        while pending is None or pending:
             if checks > 0:
-                time.sleep(1)
-            try:
-                daos_state = self.get_single_system_state().lower()
-            except ServerFailed as error:
-                raise error
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                time.sleep(min(1.0, 0.05 * 2 ** (checks - 1), remaining))
+
+            # Query every rank on the first check, or if a rank is missing from
+            # the last query, and otherwise only the ranks not in a valid state
+            current = self.get_current_state(ranks=pending, use_cache=True)
+            if not current:
+                raise ServerFailed(
+                    "Error obtaining {} output: {}".format(self.dmg, current))
+            if pending is None:
+                data = current
+            else:
+                data.update(current)
             checks += 1
-            self.log.info("System state check (%s): %s", checks, daos_state)
-        if daos_state not in valid_states:
+
+            missing = [rank for rank in pending or [] if rank not in current]
+            pending = None if missing else [
+                rank for rank, info in data.items()
+                if str(info.get("state")).lower() not in states]
+            self.log.info(
+                "System state check (%s): %s", checks,
+                sorted({str(info.get("state")).lower()
+                        for info in data.values()}))
+
+        if pending is None or pending:
             raise ServerFailed(
                 "Error checking DAOS state, currently neither {} after "
                 "{} state check(s)!".format(valid_states, checks))
-        return daos_state
+        return self._get_homogeneous_state(data).lower()
 
     def system_start(self):
         """Start the DAOS I/O Engines.
@@ -819,8 +1079,11 @@ class DaosServerManager(SubprocessManager):
 
         """
         self.log.info("Starting DAOS I/O Engines")
-        self.check_system_state(("stopped"))
+        self._config_value_cache.clear()
+        self.manager.job.update_engine_view()
+        self.check_system_state(("stopped",))
         self.dmg.system_start()
+        self._query_cache = None
         if self.dmg.result.exit_status != 0:
             raise ServerFailed(
                 "Error starting DAOS:\n{}".format(self.dmg.result))
@@ -837,12 +1100,13 @@ class DaosServerManager(SubprocessManager):
             ServerFailed: if there was an error stopping the servers
 
         """
-        valid_states = ["started", "joined"]
+        valid_states = ("started", "joined")
         if extra_states:
-            valid_states.extend(extra_states)
+            valid_states += tuple(extra_states)
         self.log.info("Stopping DAOS I/O Engines")
         self.check_system_state(valid_states)
         self.dmg.system_stop(force=True)
+        self._query_cache = None
         if self.dmg.result.exit_status != 0:
             raise ServerFailed(
                 "Error stopping DAOS:\n{}".format(self.dmg.result))
@@ -863,11 +1127,11 @@ class DaosServerManager(SubprocessManager):
 
             Args:
                 capacity_type (str): the capacity type, e.g. "scm" or "nvme"
-                device_names (list): the device names we'll use to get the total
-                    storage size
+                device_names (frozenset): the device names we'll use to get the
+                    total storage size
                 storage_dict (dict): JSON output at "HostStorage"
                 host_hash (str): Hash under "HostStorage"
-                host_capacity (dict): Dictionary to store the sum
+                host_capacity (defaultdict): Dictionary to store the sum
 
             Returns:
                 dict: a dictionary of total storage size in device_names per
@@ -878,30 +1142,15 @@ class DaosServerManager(SubprocessManager):
             # hosts such as wolf-[1-7].
             hosts = storage_dict[host_hash]["hosts"].split(":")[0]
 
-            if capacity_type == "nvme":
-                # Get nvme_devices list, iterate it, and sum the sizes.
-                nvme_devices = storage_dict[host_hash]["storage"][
-                    "nvme_devices"]
-                for nvme_device in nvme_devices:
-                    if nvme_device["pci_addr"] in device_names:
-                        for namespace in nvme_device["namespaces"]:
-                            size = namespace["size"]
-                            if hosts in host_capacity:
-                                host_capacity[hosts] += size
-                            else:
-                                host_capacity[hosts] = size
-
-            elif capacity_type == "scm":
-                # Get scm_namespaces list, iterate it, and sum the sizes.
-                scm_namespaces = storage_dict[host_hash]["storage"][
-                    "scm_namespaces"]
-                for scm_namespace in scm_namespaces:
-                    if scm_namespace["blockdev"] in device_names:
-                        size = scm_namespace["size"]
-                        if hosts in host_capacity:
-                            host_capacity[hosts] += size
-                        else:
-                            host_capacity[hosts] = size
+            # Sum the sizes of the matching devices or their namespaces
+            devices_key, name_key, namespaces_key = \
+                _CAPACITY_KEYS[capacity_type]
+            for device in storage_dict[host_hash]["storage"][devices_key]:
+                if device[name_key] in device_names:
+                    namespaces = \
+                        device[namespaces_key] if namespaces_key else [device]
+                    for namespace in namespaces:
+                        host_capacity[hosts] += namespace["size"]
 
             return host_capacity
 
@@ -918,7 +1167,8 @@ class DaosServerManager(SubprocessManager):
                     host rank
 
             """
-            host_capacity = {}
+            host_capacity = defaultdict(int)
+            device_set = frozenset(device_names)
 
             # Get nvme_devices and scm_namespaces list that are buried. There's
             # a uint64 hash of the strcut under HostStorage.
@@ -929,10 +1179,10 @@ class DaosServerManager(SubprocessManager):
             # with the identical configuration.
             for host_hash in struct_hashes:
                 host_capacity = fill_host_capacity(
-                    capacity_type, device_names, storage_dict, host_hash,
+                    capacity_type, device_set, storage_dict, host_hash,
                     host_capacity)
 
-            return host_capacity
+            return dict(host_capacity)
 
         # Default maximum bytes for SCM and NVMe
         storage = [0, 0]
@@ -940,14 +1190,30 @@ class DaosServerManager(SubprocessManager):
         using_dcpm = self.manager.job.using_dcpm
         using_nvme = self.manager.job.using_nvme
 
+        # Reuse the sizes found for the same hosts and storage config to avoid
+        # restarting the DAOS I/O Engines to scan the storage again
+        cache_key = (
+            tuple(self._hosts),
+            tuple(sorted(self.get_config_value("scm_list") or [])),
+            tuple(sorted(self.get_config_value("bdev_list") or [])),
+            self.get_config_value("scm_size"), using_dcpm, using_nvme)
+        if self._storage_cache is not None \
+                and self._storage_cache[0] == cache_key:
+            storage = list(self._storage_cache[1])
+            self.log.info(
+                "Total available storage (cached):\n  SCM:  %s (%s)\n"
+                "  NVMe: %s (%s)",
+                str(storage[0]), bytes_to_human(storage[0], binary=False),
+                str(storage[1]), bytes_to_human(storage[1], binary=False))
+            return storage
+
         if using_dcpm or using_nvme:
             # Stop the DAOS I/O Engines in order to be able to scan the storage
             self.system_stop()
 
             # Scan all of the hosts for their SCM and NVMe storage
-            self._prepare_dmg_hostlist(self._hosts)
-            data = self.dmg.storage_scan(verbose=True)
-            self._prepare_dmg_hostlist()
+            with self._dmg_hostlist(self._hosts):
+                data = self.dmg.storage_scan(verbose=True)
             if self.dmg.result.exit_status != 0:
                 raise ServerFailed(
                     "Error obtaining DAOS storage:\n{}".format(self.dmg.result))
@@ -957,14 +1223,16 @@ class DaosServerManager(SubprocessManager):
 
         if using_dcpm:
             # Find the sizes of the configured SCM storage
+            basename = os.path.basename
             scm_devices = [
-                os.path.basename(path)
+                basename(path)
                 for path in self.get_config_value("scm_list") if path]
             capacity = get_host_capacity("scm", scm_devices)
             for host in sorted(capacity):
                 self.log.info("SCM capacity for %s: %s", host, capacity[host])
             # Use the minimum SCM storage across all servers
-            storage[0] = capacity[min(capacity, key=capacity.get)]
+            if capacity:
+                storage[0] = min(capacity.values())
         else:
             # Use the assigned scm_size
             scm_size = self.get_config_value("scm_size")
@@ -976,18 +1244,29 @@ class DaosServerManager(SubprocessManager):
                 "nvme", self.get_config_value("bdev_list"))
             for host in sorted(capacity):
                 self.log.info("NVMe capacity for %s: %s", host, capacity[host])
-            # Use the minimum SCM storage across all servers
-            storage[1] = capacity[min(capacity, key=capacity.get)]
+            # Use the minimum NVMe storage across all servers
+            if capacity:
+                storage[1] = min(capacity.values())
 
         self.log.info(
             "Total available storage:\n  SCM:  %s (%s)\n  NVMe: %s (%s)",
             str(storage[0]), bytes_to_human(storage[0], binary=False),
             str(storage[1]), bytes_to_human(storage[1], binary=False))
+        self._storage_cache = (cache_key, tuple(storage))
         return storage
 
-    def get_current_state(self):
+    def get_current_state(self, ranks=None, use_cache=False):
         """Get the current state of the daos_server ranks.
 
+        Args:
+            ranks (list, optional): only query the state of these ranks.
+                Defaults to None - query all the ranks.
+            use_cache (bool, optional): whether to reuse the states of all the
+                ranks obtained by another call with this option within the
+                last self._state_ttl seconds. Only meant for polling the system
+                state, as the cache is not cleared by dmg commands issued
+                outside of this object. Defaults to False.
+
         Returns:
             dict: dictionary of server rank keys, each referencing a dictionary
                 of information containing at least the following information:
@@ -996,32 +1275,52 @@ class DaosServerManager(SubprocessManager):
                 query output.
 
         """
+        use_cache = use_cache and ranks is None
+        now = time.monotonic()
+        if use_cache and self._query_cache is not None \
+                and now - self._query_cache[0] < self._state_ttl:
+            return {rank: dict(info) for rank, info in self._query_cache[1]}
+
         data = {}
         try:
-            query_data = self.dmg.system_query()
+            if ranks is None:
+                query_data = self.dmg.system_query()
+            else:
+                query_data = self.dmg.system_query(
+                    ranks=convert_list(value=sorted(ranks)))
         except CommandFailure:
             query_data = {"status": 1}
         if query_data["status"] == 0:
             if "response" in query_data and "members" in query_data["response"]:
                 for member in query_data["response"]["members"]:
-                    host = member["fault_domain"].split(".")[0].replace("/", "")
-                    if host in self._hosts:
+                    match = _FAULT_DOMAIN_RE.match(member["fault_domain"])
+                    host = match.group(1) if match else None
+                    if host in self._hosts_set:
                         data[member["rank"]] = {
                             "uuid": member["uuid"],
                             "host": host,
                             "state": member["state"],
                         }
+        if data and use_cache:
+            self._query_cache = (
+                now, tuple((rank, dict(info)) for rank, info in data.items()))
         return data
 
     @fail_on(CommandFailure)
-    def stop_ranks(self, ranks, daos_log, force=False):
+    def stop_ranks(self, ranks, daos_log, force=False, batch=None):
         """Kill/Stop the specific server ranks using this pool.
 
+        The ranks are stopped with one 'dmg system stop' command per batch of
+        ranks.  If any command fails, self.dmg.result is left set to the result
+        of the first failed command.
+
         Args:
             ranks (list): a list of daos server ranks (int) to kill
             daos_log (DaosLog): object for logging messages
             force (bool, optional): whether to use --force option to dmg system
                 stop. Defaults to False.
+            batch (int, optional): maximum number of ranks to stop with each
+                dmg command. Defaults to None - use STOP_RANKS_BATCH.
 
         Raises:
             avocado.core.exceptions.TestFail: if there is an issue stopping the
@@ -1034,7 +1333,20 @@ class DaosServerManager(SubprocessManager):
         daos_log.info(msg)
 
         # Stop desired ranks using dmg
-        self.dmg.system_stop(ranks=convert_list(value=ranks), force=force)
+        ranks = list(ranks)
+        batch = batch or self.STOP_RANKS_BATCH
+        failed = None
+        try:
+            for index in range(0, len(ranks), batch):
+                self.dmg.system_stop(
+                    ranks=convert_list(value=ranks[index:index + batch]),
+                    force=force)
+                if failed is None and self.dmg.result.exit_status != 0:
+                    failed = self.dmg.result
+        finally:
+            self._query_cache = None
+        if failed is not None:
+            self.dmg.result = failed
 
         # Update the expected status of the stopped/excluded ranks
         self.update_expected_states(ranks, ["stopped", "excluded"])
@@ -1054,6 +1366,27 @@ class DaosServerManager(SubprocessManager):
             host = self._expected_states[rank]["host"]
         return host
 
+    def _get_engine_yaml_parameters(self, index, engine):
+        """Get the SCM-related engine parameters from a generated engine config.
+
+        Args:
+            index (int): engine index
+            engine (dict): generated config of the engine
+
+        Returns:
+            PerEngineYamlParameters: the engine parameters
+
+        """
+        self.log.info(
+            "engine %d: scm_mount = %s, scm_class = %s, scm_list = %s", index,
+            engine["scm_mount"], engine["scm_class"], engine["scm_list"])
+        engine_params = DaosServerYamlParameters.PerEngineYamlParameters(index)
+        engine_params.scm_mount.update(engine["scm_mount"])
+        engine_params.scm_class.update(engine["scm_class"])
+        engine_params.scm_size.update(None)
+        engine_params.scm_list.update(engine["scm_list"])
+        return engine_params
+
     def update_config_file_from_file(self, dst_hosts, test_dir, generated_yaml):
         """Update config file and object.
 
@@ -1072,23 +1405,37 @@ class DaosServerManager(SubprocessManager):
         # Create a temporary file in test_dir and write the generated config.
         temp_file_path = os.path.join(test_dir, "temp_server.yml")
         try:
-            with open(temp_file_path, 'w') as write_file:
-                yaml.dump(generated_yaml, write_file, default_flow_style=False)
+            serialized = yaml.dump(
+                generated_yaml, Dumper=YAML_SAFE_DUMPER,
+                default_flow_style=False, encoding="utf-8")
+            with open(temp_file_path, 'wb') as write_file:
+                write_file.write(serialized)
         except Exception as error:
             raise CommandFailure(
                 "Error writing the yaml file! {}: {}".format(
                     temp_file_path, error)) from error
 
-        # Copy the config from temp dir to /etc/daos of the server node.
-        default_server_config = get_default_config_file("server")
-        try:
-            distribute_files(
-                dst_hosts, temp_file_path, default_server_config,
-                verbose=False, sudo=True)
-        except DaosTestError as error:
-            raise CommandFailure(
-                "ERROR: Copying yaml configuration file to {}: "
-                "{}".format(dst_hosts, error)) from error
+        # Copy the config from temp dir to /etc/daos of the server node, unless
+        # the same config has already been copied to the same hosts.
+        digest = hashlib.sha256(serialized).hexdigest()
+        if digest == self._pushed_config_digest \
+                and set(dst_hosts) == self._pushed_config_hosts:
+            self.log.info(
+                "Server config unchanged on %s; not copying %s",
+                dst_hosts, temp_file_path)
+        else:
+            default_server_config = get_default_config_file("server")
+            self._pushed_config_digest = None
+            try:
+                distribute_files(
+                    dst_hosts, temp_file_path, default_server_config,
+                    verbose=False, sudo=True)
+            except DaosTestError as error:
+                raise CommandFailure(
+                    "ERROR: Copying yaml configuration file to {}: "
+                    "{}".format(dst_hosts, error)) from error
+            self._pushed_config_digest = digest
+            self._pushed_config_hosts = set(dst_hosts)
 
         # Before restarting daos_server, we need to clear SCM. Unmount the mount
         # point, wipefs the disks, etc. This clearing step is built into the
@@ -1096,20 +1443,9 @@ class DaosServerManager(SubprocessManager):
         # server_manager and clear the SCM set there, so we need to overwrite it
         # before starting to the values from the generated config.
         self.log.info("Resetting engine_params")
-        self.manager.job.yaml.engine_params = []
-        engines = generated_yaml["engines"]
-        for i, engine in enumerate(engines):
-            self.log.info("engine %d", i)
-            self.log.info("scm_mount = %s", engine["scm_mount"])
-            self.log.info("scm_class = %s", engine["scm_class"])
-            self.log.info("scm_list = %s", engine["scm_list"])
-
-            per_engine_yaml_parameters =\
-                DaosServerYamlParameters.PerEngineYamlParameters(i)
-            per_engine_yaml_parameters.scm_mount.update(engine["scm_mount"])
-            per_engine_yaml_parameters.scm_class.update(engine["scm_class"])
-            per_engine_yaml_parameters.scm_size.update(None)
-            per_engine_yaml_parameters.scm_list.update(engine["scm_list"])
-
-            self.manager.job.yaml.engine_params.append(
-                per_engine_yaml_parameters)
+        self.manager.job.yaml.engine_params = [
+            self._get_engine_yaml_parameters(index, engine)
+            for index, engine in enumerate(generated_yaml["engines"])]
+        self.manager.job.update_engine_view()
+        self._config_value_cache.clear()
+        self._storage_cache = None